@@ -168,6 +168,13 @@ class NANDFlasher:
             },
         }
 
+        # Manual-selection menu, cached once since supported_nand is fixed after init
+        self._nand_names = list(self.supported_nand.keys())
+        self._nand_lines = [f"{i+1}:{n}\n".encode() for i, n in enumerate(self._nand_names)]
+
+        # Preformatted text-mode progress lines, indexed by percent
+        self._PROGRESS_STRS = [f"PROGRESS:{i}\n".encode() for i in range(101)]
+
         self.current_nand = (None, None)
         # Control flags for protocol-level pause/cancel
         self.cancelled = False
@@ -489,21 +496,23 @@ class NANDFlasher:
             self.uart.write("NAND_NOT_CONNECTED\n")
             return
 
-        info = self.current_nand[1]
-        total_pages = info["blocks"] * info["block_size"]
-        page_size = info["page_size"]
-        spare_size = 64
-        if page_size == 4096:
-            spare_size = 128
-        elif page_size == 2048:
+        try:
+            info = self.current_nand[1]
+            total_pages = info["blocks"] * info["block_size"]
+            page_size = info["page_size"]
             spare_size = 64
+            if page_size == 4096:
+                spare_size = 128
+            elif page_size == 2048:
+                spare_size = 64
 
-        page_total_size = page_size + spare_size
+            page_total_size = page_size + spare_size
 
-        # Buffer for one page + spare
-        page_buffer = bytearray(page_total_size)
+            # Buffer for one page + spare
+            page_buffer = bytearray(page_total_size)
+            # Each page is announced with its length so the host can read it as raw bytes
+            data_header = f"DATA:{page_total_size}\n".encode()
 
-        try:
             # Reset control flags at start
             self.cancelled = False
             self.paused = False
@@ -517,11 +526,12 @@ class NANDFlasher:
                     return
 
                 # Send page data via UART
+                self.uart.write(data_header)
                 self.uart.write(page_buffer)
 
                 # Send progress
                 progress = int((page + 1) * 100 / total_pages)
-                self.uart.write(f"PROGRESS:{progress}\n")
+                self.uart.write(self._PROGRESS_STRS[progress])
 
             self.uart.write("OPERATION_COMPLETE\n")
         except Exception:
@@ -535,21 +545,21 @@ class NANDFlasher:
             self.uart.write("NAND_NOT_CONNECTED\n")
             return
 
-        info = self.current_nand[1]
-        total_pages = info["blocks"] * info["block_size"]
-        page_size = info["page_size"]
-        spare_size = 64
-        if page_size == 4096:
-            spare_size = 128
-        elif page_size == 2048:
+        try:
+            info = self.current_nand[1]
+            total_pages = info["blocks"] * info["block_size"]
+            page_size = info["page_size"]
             spare_size = 64
+            if page_size == 4096:
+                spare_size = 128
+            elif page_size == 2048:
+                spare_size = 64
 
-        page_total_size = page_size + (spare_size if include_oob else 0)
+            page_total_size = page_size + (spare_size if include_oob else 0)
 
-        # Signal that we're ready to receive data
-        self.uart.write("READY_FOR_DATA\n")
+            # Signal that we're ready to receive data
+            self.uart.write("READY_FOR_DATA\n")
 
-        try:
             # Reset control flags at start
             self.cancelled = False
             self.paused = False
@@ -577,7 +587,7 @@ class NANDFlasher:
 
                 # Send progress
                 progress = int((page + 1) * 100 / total_pages)
-                self.uart.write(f"PROGRESS:{progress}\n")
+                self.uart.write(self._PROGRESS_STRS[progress])
 
             self.uart.write("OPERATION_COMPLETE\n")
         except Exception:
@@ -589,10 +599,10 @@ class NANDFlasher:
             self.uart.write("NAND_NOT_CONNECTED\n")
             return
 
-        info = self.current_nand[1]
-        total_blocks = info["blocks"]
-
         try:
+            info = self.current_nand[1]
+            total_blocks = info["blocks"]
+
             # Reset control flags at start
             self.cancelled = False
             self.paused = False
@@ -606,35 +616,32 @@ class NANDFlasher:
 
                 # Send progress
                 progress = int((block + 1) * 100 / total_blocks)
-                self.uart.write(f"PROGRESS:{progress}\n")
+                self.uart.write(self._PROGRESS_STRS[progress])
 
             self.uart.write("OPERATION_COMPLETE\n")
         except Exception:
             self.uart.write("OPERATION_FAILED\n")
 
     def handle_operation(self, cmd):
-        """Handle operation commands"""
+        """Handle operation commands (each operation reports its own failures)"""
         if not self.current_nand[0]:
             self.uart.write("NAND_NOT_CONNECTED\n")
             return
-        try:
-            if cmd == "READ":
-                self.read_nand_operation()
-            elif cmd == "WRITE":
-                self.write_nand_operation(True)
-            elif cmd == "WRITE_NO_OOB":
-                self.write_nand_operation(False)
-            elif cmd == "ERASE":
-                self.erase_nand_operation()
-        except Exception:
-            self.uart.write("OPERATION_FAILED\n")
+        if cmd == "READ":
+            self.read_nand_operation()
+        elif cmd == "WRITE":
+            self.write_nand_operation(True)
+        elif cmd == "WRITE_NO_OOB":
+            self.write_nand_operation(False)
+        elif cmd == "ERASE":
+            self.erase_nand_operation()
 
     def select_nand_manually(self):
         """Manual NAND model selection"""
         self.uart.write("MANUAL_SELECT_START\n")
-        names = list(self.supported_nand.keys())
-        for i, name in enumerate(names):
-            self.uart.write(f"{i+1}:{name}\n")
+        names = self._nand_names
+        for line in self._nand_lines:
+            self.uart.write(line)
         self.uart.write("MANUAL_SELECT_END\n")
 
         # Wait for user selection
@@ -646,7 +653,7 @@ class NANDFlasher:
                     if 0 <= index < len(names):
                         name = names[index]
                         return (name, self.supported_nand[name])
-                except Exception:
+                except (ValueError, IndexError):
                     pass
 
     def main_loop(self):
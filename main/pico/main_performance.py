@@ -51,6 +51,38 @@ def nand_io_program():
     push().side(0b11)  # Push to FIFO, WE#=HIGH, RE#=HIGH
 
 
+def _make_crc32_table():
+    """Build the 256-entry lookup table for the reflected CRC32 polynomial"""
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ 0xEDB88320
+            else:
+                crc >>= 1
+        table.append(crc)
+    return table
+
+
+_CRC32_TABLE = _make_crc32_table()
+
+
+def _crc32_update_py(crc, data):
+    """Feed data into a running (non-finalized) CRC32 state"""
+    table = _CRC32_TABLE
+    for b in data:
+        crc = table[(crc ^ b) & 0xFF] ^ (crc >> 8)
+    return crc
+
+
+# Prefer the native .mpy build (pico/native) when it has been copied to the board
+try:
+    from crc32_native import crc32_update as _crc32_update_impl
+except ImportError:
+    _crc32_update_impl = _crc32_update_py
+
+
 class NANDFlasher:
     """Main class for NAND Flash operations on 
     Raspberry Pi Pico with enhanced performance features"""
@@ -87,6 +119,7 @@ class NANDFlasher:
         self.vsys_adc = ADC(29)  # VSYS / 3 voltage
         self.vref = 3.3  # Reference voltage
         self.adc_to_voltage_factor = 3.0  # VSYS is divided by 3
+        self.power_check_interval_ms = 250  # Time-based cadence, independent of page rate
 
         # Initialize control pins to inactive state
         self.cle_pin.value(0)
@@ -236,12 +269,21 @@ class NANDFlasher:
                 },
             }
 
+        # Manual-selection menu, cached once since supported_nand is fixed after init
+        self._nand_names = list(self.supported_nand.keys())
+        self._nand_lines = [f"{i+1}:{n}\n".encode() for i, n in enumerate(self._nand_names)]
+
+        # Preformatted text-mode progress lines, indexed by percent
+        self._PROGRESS_STRS = [f"PROGRESS:{i}\n".encode() for i in range(101)]
+
         self.current_nand = (None, None)
 
         # Resume functionality
         self.last_block_position = 0
         self.operation_state = None  # To store operation context for resume
-        self.hash_chunks = {}  # Store hash of processed chunks for verification
+        # Fixed-size ring of recent (operation, block, hash) checkpoints for verification
+        self._resume_ring = [(None, None, None)] * 8
+        self._resume_idx = 0
 
         # Compression settings
         self.use_compression = True
@@ -262,6 +304,19 @@ class NANDFlasher:
         self.CMD_MODEL = 0x14
         self.CMD_POWER_WARNING = 0x15
         self.CMD_PAGE_CRC = 0x16
+        # Reusable frame buffers: MAGIC(2) + CMD(1) + LEN(4), and CRC32(4)
+        self._hdr = bytearray(7)
+        self._hdr[0:2] = self.MAGIC
+        self._hdr_mv = memoryview(self._hdr)
+        self._crcbuf = bytearray(4)
+        # Preformatted PROGRESS frame: MAGIC + CMD + LEN(6) + [percent u16][index u32] + CRC32
+        self._progress_frame = bytearray(17)
+        self._progress_frame[0:2] = self.MAGIC
+        self._progress_frame[2] = self.CMD_PROGRESS
+        struct.pack_into("<I", self._progress_frame, 3, 6)
+        self._progress_mv = memoryview(self._progress_frame)
+        # Bytes read ahead of the current frame while scanning for MAGIC
+        self._rx_pending = b""
 
     def _get_supported_nand_from_plugins(self):
         """Get supported NAND chips from plugin system"""
@@ -489,20 +544,7 @@ class NANDFlasher:
 
     def calculate_chunk_hash(self, data):
         """Calculate CRC32 hash for data verification"""
-        # CRC32 implementation for MicroPython
-        # Using the standard CRC32 polynomial 0xEDB88320
-        crc = 0xFFFFFFFF  # Start with all 1s
-        for byte in data:
-            # XOR the byte into the least significant byte of crc
-            crc ^= byte
-            # Process each bit
-            for _ in range(8):
-                if crc & 1:  # If LSB is set
-                    crc = (crc >> 1) ^ 0xEDB88320
-                else:
-                    crc >>= 1
-        # Return the bitwise complement
-        return crc ^ 0xFFFFFFFF
+        return self._crc32(data)
 
     def compress_data(self, data):
         """Compress data using simple RLE (Run-Length Encoding)"""
@@ -709,14 +751,19 @@ class NANDFlasher:
     def save_resume_state(self, operation, block_pos, hash_val):
         """Save operation state for resume capability"""
         self.last_block_position = block_pos
-        if operation not in self.hash_chunks:
-            self.hash_chunks[operation] = {}
-        self.hash_chunks[operation][block_pos] = hash_val
+        idx = self._resume_idx
+        self._resume_ring[idx] = (operation, block_pos, hash_val)
+        self._resume_idx = (idx + 1) % len(self._resume_ring)
 
     def load_resume_state(self, operation):
         """Load operation state for resume capability"""
-        if operation in self.hash_chunks:
-            return self.hash_chunks[operation].get(self.last_block_position, None)
+        ring = self._resume_ring
+        idx = self._resume_idx
+        # Walk newest to oldest; only recent checkpoints are kept
+        for i in range(1, len(ring) + 1):
+            op, block_pos, hash_val = ring[(idx - i) % len(ring)]
+            if op == operation and block_pos == self.last_block_position:
+                return hash_val
         return None
 
     def read_nand_operation(self):
@@ -728,28 +775,29 @@ class NANDFlasher:
                 self.uart.write("NAND_NOT_CONNECTED\n")
             return
 
-        info = self.current_nand[1]
-        total_pages = info["blocks"] * info["block_size"]
-        page_size = info["page_size"]
-        spare_size = 64
-        if page_size == 4096:
-            spare_size = 128
-        elif page_size == 2048:
+        try:
+            info = self.current_nand[1]
+            total_pages = info["blocks"] * info["block_size"]
+            page_size = info["page_size"]
             spare_size = 64
+            if page_size == 4096:
+                spare_size = 128
+            elif page_size == 2048:
+                spare_size = 64
 
-        page_total_size = page_size + spare_size
+            page_total_size = page_size + spare_size
 
-        # Buffer for one page + spare
-        page_buffer = bytearray(page_total_size)
+            # Buffer for one page + spare
+            page_buffer = bytearray(page_total_size)
 
-        # Check if we have resume state
-        start_page = 0
-        if self.last_block_position > 0:
-            resume_hash = self.load_resume_state("READ")
-            if resume_hash is not None:
-                start_page = self.last_block_position * info["block_size"]
+            # Check if we have resume state
+            start_page = 0
+            if self.last_block_position > 0:
+                resume_hash = self.load_resume_state("READ")
+                if resume_hash is not None:
+                    start_page = self.last_block_position * info["block_size"]
 
-        try:
+            last_power_check = time.ticks_ms()
             for page in range(start_page, total_pages):
                 if not self.read_page(info, page, page_buffer):
                     if self.binary_mode:
@@ -760,7 +808,7 @@ class NANDFlasher:
                 # Data emission
                 if self.binary_mode:
                     # In framed mode, send raw page (no compression to keep Pico simple)
-                    self._send_frame(self.CMD_READ, bytes(page_buffer))
+                    self._send_frame(self.CMD_READ, page_buffer)
                 else:
                     # Legacy path with optional compression/blank skipping
                     if self.skip_blank_pages and self.is_blank_page(page_buffer, page_size):
@@ -786,15 +834,14 @@ class NANDFlasher:
                 # Progress (send percent and page index)
                 progress = int((page + 1) * 100 / total_pages)
                 if self.binary_mode:
-                    payload = bytes([progress & 0xFF, (progress >> 8) & 0xFF]) + struct.pack(
-                        "<I", page
-                    )
-                    self._send_frame(self.CMD_PROGRESS, payload)
+                    self._send_progress_frame(progress, page)
                 else:
-                    self.uart.write(f"PROGRESS:{progress}\n")
+                    self.uart.write(self._PROGRESS_STRS[progress])
 
                 # Power warning
-                if page % 100 == 0:
+                now = time.ticks_ms()
+                if time.ticks_diff(now, last_power_check) > self.power_check_interval_ms:
+                    last_power_check = now
                     power_ok, power_msg = self.check_power_supply()
                     if not power_ok:
                         if self.binary_mode:
@@ -818,32 +865,37 @@ class NANDFlasher:
             self.uart.write("NAND_NOT_CONNECTED\n")
             return
 
-        info = self.current_nand[1]
-        total_pages = info["blocks"] * info["block_size"]
-        page_size = info["page_size"]
-        spare_size = 64
-        if page_size == 4096:
-            spare_size = 128
-        elif page_size == 2048:
+        try:
+            info = self.current_nand[1]
+            total_pages = info["blocks"] * info["block_size"]
+            page_size = info["page_size"]
             spare_size = 64
+            if page_size == 4096:
+                spare_size = 128
+            elif page_size == 2048:
+                spare_size = 64
 
-        page_total_size = page_size + spare_size
+            page_total_size = page_size + spare_size
 
-        # Check if we have resume state
-        start_page = 0
-        if self.last_block_position > 0:
-            resume_hash = self.load_resume_state("WRITE")
-            if resume_hash is not None:
-                start_page = self.last_block_position * info["block_size"]
+            # Check if we have resume state
+            start_page = 0
+            if self.last_block_position > 0:
+                resume_hash = self.load_resume_state("WRITE")
+                if resume_hash is not None:
+                    start_page = self.last_block_position * info["block_size"]
 
-        # Signal that we're ready to receive data
-        if self.binary_mode:
-            self._send_frame(self.CMD_READY_FOR_DATA, b"")
-        else:
-            self.uart.write("READY_FOR_DATA\n")
+            # Signal that we're ready to receive data
+            if self.binary_mode:
+                self._send_frame(self.CMD_READY_FOR_DATA, b"")
+            else:
+                self.uart.write("READY_FOR_DATA\n")
 
-        try:
+            # One page buffer for the whole operation, refilled in place
             page_buffer = bytearray(page_total_size)
+            page_mv = memoryview(page_buffer)
+            ff_page = b"\xff" * page_total_size
+            ff_hash = self.calculate_chunk_hash(ff_page)
+            last_power_check = time.ticks_ms()
             for page in range(start_page, total_pages):
                 # Receive data for this page
                 bytes_received = 0
@@ -851,22 +903,30 @@ class NANDFlasher:
                     if self.binary_mode:
                         # Expect data frames with CMD_WRITE
                         cmd, payload = self._read_frame_blocking()
+                        if cmd is None or cmd == self.CMD_ERROR:
+                            # A corrupted (CRC mismatch) or missing data frame would shift
+                            # every later chunk to the wrong page offset; fail instead
+                            reason = b"CRC_MISMATCH" if cmd is None else b"DATA_TIMEOUT"
+                            self._send_frame(self.CMD_ERROR, reason)
+                            # Drop the data frames still in flight so they are not
+                            # taken as new commands
+                            self._discard_input()
+                            return
                         if cmd != self.CMD_WRITE:
                             continue
-                        for i in range(len(payload)):
-                            if bytes_received + i < page_total_size:
-                                page_buffer[bytes_received + i] = payload[i]
+                        n = min(len(payload), page_total_size - bytes_received)
+                        page_mv[bytes_received : bytes_received + n] = payload[:n]
                         bytes_received += len(payload)
                     else:
                         if self.uart.any():
-                            chunk = self.uart.read(min(page_total_size - bytes_received, 256))
-                            if chunk:
-                                for i, b in enumerate(chunk):
-                                    if bytes_received + i < page_total_size:
-                                        page_buffer[bytes_received + i] = b
-                                bytes_received += len(chunk)
+                            # Fill the page buffer in place, no per-chunk bytes objects
+                            end = min(page_total_size, bytes_received + 256)
+                            n = self.uart.readinto(page_mv[bytes_received:end])
+                            if n:
+                                bytes_received += n
 
                 # Decompress if needed
+                page_data = page_buffer
                 if (
                     self.use_compression
                     and page_buffer[0] == 0x00
@@ -874,27 +934,32 @@ class NANDFlasher:
                     and page_buffer[2] == 0xFF
                 ):
                     # This is a blank page marker, fill with 0xFF
-                    for i in range(page_total_size):
-                        page_buffer[i] = 0xFF
+                    page_buffer[:] = ff_page
                 elif self.use_compression:
                     # This might be compressed data, decompress if needed
-                    page_buffer = self.decompress_data(page_buffer)
+                    page_data = self.decompress_data(page_buffer)
 
-                if not self.write_page(info, page, page_buffer):
+                if not self.write_page(info, page, page_data):
                     self.uart.write("OPERATION_FAILED\n")
                     return
 
                 # Calculate and save hash for resume verification
-                page_hash = self.calculate_chunk_hash(page_buffer)
+                # (erased all-0xFF pages reuse the precomputed hash)
+                if page_data == ff_page:
+                    page_hash = ff_hash
+                else:
+                    page_hash = self.calculate_chunk_hash(page_data)
                 block_num = page // info["block_size"]
                 self.save_resume_state("WRITE", block_num, page_hash)
 
                 # Send progress
                 progress = int((page + 1) * 100 / total_pages)
-                self.uart.write(f"PROGRESS:{progress}\n")
+                self.uart.write(self._PROGRESS_STRS[progress])
 
                 # Check power supply periodically
-                if page % 100 == 0:  # Every 100 pages
+                now = time.ticks_ms()
+                if time.ticks_diff(now, last_power_check) > self.power_check_interval_ms:
+                    last_power_check = now
                     power_ok, power_msg = self.check_power_supply()
                     if not power_ok:
                         self.uart.write(f"POWER_WARNING:{power_msg}\n")
@@ -909,13 +974,14 @@ class NANDFlasher:
             self.uart.write("NAND_NOT_CONNECTED\n")
             return
 
-        info = self.current_nand[1]
-        total_blocks = info["blocks"]
+        try:
+            info = self.current_nand[1]
+            total_blocks = info["blocks"]
 
-        # Check if we have resume state
-        start_block = self.last_block_position
+            # Check if we have resume state
+            start_block = self.last_block_position
 
-        try:
+            last_power_check = time.ticks_ms()
             for block in range(start_block, total_blocks):
                 if not self.erase_block(info, block):
                     self.uart.write("OPERATION_FAILED\n")
@@ -927,15 +993,14 @@ class NANDFlasher:
                 # Send progress (percent and block index)
                 progress = int((block + 1) * 100 / total_blocks)
                 if self.binary_mode:
-                    payload = bytes([progress & 0xFF, (progress >> 8) & 0xFF]) + struct.pack(
-                        "<I", block
-                    )
-                    self._send_frame(self.CMD_PROGRESS, payload)
+                    self._send_progress_frame(progress, block)
                 else:
-                    self.uart.write(f"PROGRESS:{progress}\n")
+                    self.uart.write(self._PROGRESS_STRS[progress])
 
                 # Check power supply periodically
-                if block % 10 == 0:  # Every 10 blocks
+                now = time.ticks_ms()
+                if time.ticks_diff(now, last_power_check) > self.power_check_interval_ms:
+                    last_power_check = now
                     power_ok, power_msg = self.check_power_supply()
                     if not power_ok:
                         self.uart.write(f"POWER_WARNING:{power_msg}\n")
@@ -945,26 +1010,23 @@ class NANDFlasher:
             self.uart.write("OPERATION_FAILED\n")
 
     def handle_operation(self, cmd):
-        """Handle operation commands"""
+        """Handle operation commands (each operation reports its own failures)"""
         if not self.current_nand[0]:
             self.uart.write("NAND_NOT_CONNECTED\n")
             return
-        try:
-            if cmd == "READ":
-                self.read_nand_operation()
-            elif cmd == "WRITE":
-                self.write_nand_operation()
-            elif cmd == "ERASE":
-                self.erase_nand_operation()
-        except Exception:
-            self.uart.write("OPERATION_FAILED\n")
+        if cmd == "READ":
+            self.read_nand_operation()
+        elif cmd == "WRITE":
+            self.write_nand_operation()
+        elif cmd == "ERASE":
+            self.erase_nand_operation()
 
     def select_nand_manually(self):
         """Manual NAND model selection"""
         self.uart.write("MANUAL_SELECT_START\n")
-        names = list(self.supported_nand.keys())
-        for i, name in enumerate(names):
-            self.uart.write(f"{i+1}:{name}\n")
+        names = self._nand_names
+        for line in self._nand_lines:
+            self.uart.write(line)
         self.uart.write("MANUAL_SELECT_END\n")
 
         # Wait for user selection
@@ -1052,6 +1114,11 @@ class NANDFlasher:
     def _read_exact(self, n, timeout_ms=5000):
         start = time.ticks_ms()
         buf = bytearray()
+        # Consume bytes already pulled from the UART by the MAGIC scan first
+        pending = self._rx_pending
+        if pending:
+            buf.extend(pending[:n])
+            self._rx_pending = pending[n:]
         while len(buf) < n:
             if self.uart.any():
                 chunk = self.uart.read(n - len(buf))
@@ -1061,46 +1128,81 @@ class NANDFlasher:
                 return None
         return bytes(buf)
 
+    def _discard_input(self, quiet_ms=200):
+        """Drop incoming bytes until the line has been idle for quiet_ms"""
+        self._rx_pending = b""
+        last = time.ticks_ms()
+        while time.ticks_diff(time.ticks_ms(), last) < quiet_ms:
+            n = self.uart.any()
+            if n:
+                self.uart.read(n)
+                last = time.ticks_ms()
+
     def _read_frame_after_magic(self):
         # after reading MAGIC, read header/payload/crc
         header = self._read_exact(5)
         if not header:
             return None, b""
         cmd = header[0]
-        length = struct.unpack("<I", header[1:5])[0]
-        payload = self._read_exact(length) if length > 0 else b""
-        self._read_exact(4)
-        # CRC is not strictly validated to keep code small; can be added
+        length = struct.unpack_from("<I", header, 1)[0]
+        # Payload and trailing CRC arrive back to back; read them in one pass
+        rest = self._read_exact(length + 4)
+        if not rest:
+            return None, b""
+        payload = rest[:length]
+        crc = self._crc32_update(self._crc32_update(0xFFFFFFFF, header), payload) ^ 0xFFFFFFFF
+        if struct.unpack_from("<I", rest, length)[0] != crc:
+            return None, b""
         return cmd, payload
 
-    def _read_frame_blocking(self):
-        # Find MAGIC
-        sync = b""
+    def _read_frame_blocking(self, timeout_ms=5000):
+        # Find MAGIC by scanning UART chunks instead of reading one byte at a time
+        scan = self._rx_pending
+        self._rx_pending = b""
+        start = time.ticks_ms()
         while True:
-            b1 = self._read_exact(1)
-            if not b1:
-                return self.CMD_ERROR, b""
-            sync = (sync + b1)[-2:]
-            if sync == self.MAGIC:
+            idx = scan.find(self.MAGIC)
+            if idx >= 0:
+                # Bytes past MAGIC belong to this (and possibly the next) frame
+                self._rx_pending = scan[idx + 2 :]
                 return self._read_frame_after_magic()
+            # Keep the last byte in case MAGIC is split across chunks
+            scan = scan[-1:]
+            chunk = self.uart.read(64) if self.uart.any() else None
+            if chunk:
+                scan += chunk
+                start = time.ticks_ms()
+            elif time.ticks_diff(time.ticks_ms(), start) > timeout_ms:
+                return self.CMD_ERROR, b""
 
     def _send_frame(self, cmd, payload=b""):
-        header = bytes([cmd]) + struct.pack("<I", len(payload))
-        crc = self._crc32(header + payload)
-        self.uart.write(self.MAGIC + header + payload + struct.pack("<I", crc))
+        # Header and CRC live in preallocated buffers; CRC is fed incrementally
+        # and pieces are written separately so no per-frame temporaries are built
+        hdr = self._hdr
+        hdr[2] = cmd
+        struct.pack_into("<I", hdr, 3, len(payload))
+        crc = self._crc32_update(self._crc32_update(0xFFFFFFFF, self._hdr_mv[2:]), payload)
+        struct.pack_into("<I", self._crcbuf, 0, crc ^ 0xFFFFFFFF)
+        self.uart.write(hdr)
+        if payload:
+            self.uart.write(payload)
+        self.uart.write(self._crcbuf)
+
+    def _send_progress_frame(self, progress, index):
+        """Send a PROGRESS frame by patching the preformatted template in place"""
+        frame = self._progress_frame
+        struct.pack_into("<HI", frame, 7, progress, index)
+        crc = self._crc32_update(0xFFFFFFFF, self._progress_mv[2:13]) ^ 0xFFFFFFFF
+        struct.pack_into("<I", frame, 13, crc)
+        self.uart.write(frame)
 
     def _crc32(self, data):
         # Simple CRC32 (same polynomial as host). MicroPython lacks zlib, 
         # so implement small version.
-        crc = 0xFFFFFFFF
-        for b in data:
-            crc ^= b
-            for _ in range(8):
-                if crc & 1:
-                    crc = (crc >> 1) ^ 0xEDB88320
-                else:
-                    crc >>= 1
-        return crc ^ 0xFFFFFFFF
+        return self._crc32_update(0xFFFFFFFF, data) ^ 0xFFFFFFFF
+
+    # Native or table-driven implementation, selected at import time
+    _crc32_update = staticmethod(_crc32_update_impl)
 
 
 # Initialize and run the NAND flasher
@@ -0,0 +1,39 @@
+// Native CRC32 for the Pico NAND Flasher firmware.
+// Build as a MicroPython dynamic native module (see Makefile) and copy
+// crc32_native.mpy next to main_performance.py on the Pico.
+
+#include "py/dynruntime.h"
+
+// Sarwate table for the reflected polynomial 0xEDB88320, filled in mpy_init
+static uint32_t crc_table[256];
+
+// crc32_update(crc, buf) -> crc
+// Feeds buf into a running (non-finalized) CRC32 state, same as the
+// pure-Python NANDFlasher._crc32_update fallback.
+static mp_obj_t crc32_update(mp_obj_t crc_in, mp_obj_t buf_in) {
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(buf_in, &bufinfo, MP_BUFFER_READ);
+    uint32_t crc = mp_obj_get_int_truncated(crc_in);
+    const uint8_t *p = bufinfo.buf;
+    for (size_t i = 0; i < bufinfo.len; i++) {
+        crc = crc_table[(crc ^ p[i]) & 0xFF] ^ (crc >> 8);
+    }
+    return mp_obj_new_int_from_uint(crc);
+}
+static MP_DEFINE_CONST_FUN_OBJ_2(crc32_update_obj, crc32_update);
+
+mp_obj_t mpy_init(mp_obj_fun_bc_t *self, size_t n_args, size_t n_kw, mp_obj_t *args) {
+    MP_DYNRUNTIME_INIT_ENTRY
+
+    for (uint32_t i = 0; i < 256; i++) {
+        uint32_t crc = i;
+        for (int j = 0; j < 8; j++) {
+            crc = (crc & 1) ? (crc >> 1) ^ 0xEDB88320 : crc >> 1;
+        }
+        crc_table[i] = crc;
+    }
+
+    mp_store_global(MP_QSTR_crc32_update, MP_OBJ_FROM_PTR(&crc32_update_obj));
+
+    MP_DYNRUNTIME_INIT_EXIT
+}
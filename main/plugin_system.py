@@ -11,6 +11,8 @@ from abc import ABC, abstractmethod
 class NANDChipPlugin(ABC):
     """Base class for NAND chip plugins"""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -85,28 +87,67 @@ class NANDChipPlugin(ABC):
         return f"{description} {details}"
 
 
+# Plugin classes registered via @register_nand_plugin, in definition order
+PLUGIN_REGISTRY: list[type[NANDChipPlugin]] = []
+
+
+def register_nand_plugin(cls: type[NANDChipPlugin]) -> type[NANDChipPlugin]:
+    """Class decorator that registers a NAND chip plugin for PluginManager"""
+    PLUGIN_REGISTRY.append(cls)
+    return cls
+
+
 class PluginManager:
     """Manages NAND chip plugins"""
 
     def __init__(self):
         self.plugins = {}
+        # chip_id[0] -> [(id prefix, plugin), ...] in registration order
+        self._by_first_byte: dict[int, list[tuple[tuple[int, ...], NANDChipPlugin]]] = {}
         self._load_default_plugins()
 
     def _load_default_plugins(self):
         """Load built-in plugins"""
         # Add some default plugins as examples
-        self.plugins["default_samsung_k9f4g08u0a"] = SamsungK9F4G08U0A()
-        self.plugins["default_hynix_hy27uf082g2b"] = HynixHY27UF082G2B()
-        self.plugins["default_toshiba_tc58nvg2s3e"] = ToshibaTC58NVG2S3E()
+        self.add_plugin("default_samsung_k9f4g08u0a", SamsungK9F4G08U0A())
+        self.add_plugin("default_hynix_hy27uf082g2b", HynixHY27UF082G2B())
+        self.add_plugin("default_toshiba_tc58nvg2s3e", ToshibaTC58NVG2S3E())
+
+    def add_plugin(self, key: str, plugin: NANDChipPlugin) -> None:
+        """Register a plugin under the given key and index it by chip ID"""
+        replaced = key in self.plugins
+        self.plugins[key] = plugin
+        if replaced:
+            self._rebuild_id_index()
+        else:
+            self._index_plugin(plugin)
+
+    def _index_plugin(self, plugin: NANDChipPlugin) -> None:
+        prefix = tuple(plugin.chip_id)
+        if prefix:
+            self._by_first_byte.setdefault(prefix[0], []).append((prefix, plugin))
+
+    def _rebuild_id_index(self) -> None:
+        self._by_first_byte = {}
+        for plugin in self.plugins.values():
+            self._index_plugin(plugin)
 
     def load_plugin_from_file(self, file_path: str) -> bool:
         """Load a plugin from a Python file"""
         try:
             spec = importlib.util.spec_from_file_location("plugin", file_path)
             module = importlib.util.module_from_spec(spec)
+            registered_before = len(PLUGIN_REGISTRY)
             spec.loader.exec_module(module)
 
-            # Look for classes that inherit from NANDChipPlugin
+            # Plugins that use @register_nand_plugin announce themselves directly
+            new_classes = PLUGIN_REGISTRY[registered_before:]
+            if new_classes:
+                for plugin_cls in new_classes:
+                    self._add_file_plugin(file_path, plugin_cls())
+                return True
+
+            # Fallback for undecorated plugins: look for classes that inherit from NANDChipPlugin
             for attr_name in dir(module):
                 attr = getattr(module, attr_name)
                 if (
@@ -114,10 +155,7 @@ class PluginManager:
                     and issubclass(attr, NANDChipPlugin)
                     and attr != NANDChipPlugin
                 ):
-                    plugin_instance = attr()
-                    plugin_name = plugin_instance.name.lower().replace(' ', '_')
-                    plugin_key = f"file_{os.path.basename(file_path)}_{plugin_name}"
-                    self.plugins[plugin_key] = plugin_instance
+                    self._add_file_plugin(file_path, attr())
                     return True
 
             return False
@@ -125,15 +163,21 @@ class PluginManager:
             print(f"Error loading plugin from {file_path}: {e}")
             return False
 
+    def _add_file_plugin(self, file_path: str, plugin_instance: NANDChipPlugin) -> None:
+        plugin_name = plugin_instance.name.lower().replace(' ', '_')
+        plugin_key = f"file_{os.path.basename(file_path)}_{plugin_name}"
+        self.add_plugin(plugin_key, plugin_instance)
+
     def load_plugins_from_directory(self, directory: str):
         """Load all plugins from a directory"""
         if not os.path.exists(directory):
             return
 
-        for filename in os.listdir(directory):
-            if filename.endswith(".py") and not filename.startswith("__"):
-                file_path = os.path.join(directory, filename)
-                self.load_plugin_from_file(file_path)
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name.endswith(".py") and not name.startswith("__") and entry.is_file():
+                    self.load_plugin_from_file(entry.path)
 
     def get_all_plugins(self) -> list[NANDChipPlugin]:
         """Get all loaded plugins"""
@@ -141,8 +185,10 @@ class PluginManager:
 
     def find_plugin_by_id(self, chip_id: list[int]) -> NANDChipPlugin | None:
         """Find a plugin that matches the given chip ID"""
-        for plugin in self.plugins.values():
-            if plugin.chip_id == chip_id[: len(plugin.chip_id)]:
+        if not chip_id:
+            return None
+        for prefix, plugin in self._by_first_byte.get(chip_id[0], ()):
+            if tuple(chip_id[: len(prefix)]) == prefix:
                 return plugin
         return None
 
@@ -160,6 +206,8 @@ class PluginManager:
 class SamsungK9F4G08U0A(NANDChipPlugin):
     """Samsung K9F4G08U0A - 512MB NAND Flash"""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "K9F4G08U0A"
@@ -199,6 +247,8 @@ class SamsungK9F4G08U0A(NANDChipPlugin):
 class HynixHY27UF082G2B(NANDChipPlugin):
     """Hynix HY27UF082G2B - 256MB NAND Flash"""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "HY27UF082G2B"
@@ -238,6 +288,8 @@ class HynixHY27UF082G2B(NANDChipPlugin):
 class ToshibaTC58NVG2S3E(NANDChipPlugin):
     """Toshiba TC58NVG2S3E - 256MB NAND Flash"""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "TC58NVG2S3E"
@@ -278,6 +330,15 @@ class ToshibaTC58NVG2S3E(NANDChipPlugin):
 class CustomNANDChip(NANDChipPlugin):
     """Example of a custom NAND chip plugin"""
 
+    __slots__ = (
+        "_name",
+        "_manufacturer",
+        "_chip_id",
+        "_page_size",
+        "_block_size",
+        "_total_blocks",
+    )
+
     def __init__(
         self,
         name: str,
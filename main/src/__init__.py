@@ -5,8 +5,19 @@ Handles CLI and GUI mode selection
 
 import sys
 
-from .cli.cli_interface import main as cli_main
-from .gui.gui_interface import main as gui_main
+
+def cli_main():
+    """Run the CLI (imported on demand so the GUI toolkit is never loaded for it)"""
+    from .cli.cli_interface import main
+
+    main()
+
+
+def gui_main():
+    """Run the GUI"""
+    from .gui.gui_interface import main
+
+    main()
 
 
 def main():
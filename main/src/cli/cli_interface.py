@@ -3,26 +3,176 @@ CLI interface for Pico NAND Flasher
 Provides command-line interface without GUI dependencies
 """
 
+import io
+import mmap
+import os
+import re
 import sys
+import time
 from argparse import ArgumentParser
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import serial.tools.list_ports
-
-from ..hardware.nand_controller import NANDController
 from ..utils.exceptions import (
     ConnectionException,
 )
 from ..utils.logging_config import get_logger, setup_logging
 
+if TYPE_CHECKING:
+    from ..hardware.nand_controller import NANDController
+
+# Minimum seconds between progress line redraws
+PROGRESS_INTERVAL = 0.05
+
+# Raspberry Pi USB vendor ID, reported by the Pico's CDC interface
+PICO_USB_VID = 0x2E8A
+_PICO_DESCRIPTION_RE = re.compile(r"Pico|Serial|UART|CDC", re.IGNORECASE)
+
+
+# Dump output: buffered writes use a 1 MiB buffer; direct I/O needs block-aligned
+# buffers and lengths
+DUMP_BUFFER_SIZE = 1 << 20
+DIRECT_IO_ALIGN = 4096
+# Without O_DIRECT, --direct bounds the dirty-page backlog by syncing this often
+DIRECT_SYNC_INTERVAL = 64 << 20
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve size bytes for a file up front (real extents where posix_fallocate exists)"""
+    if hasattr(os, "posix_fallocate"):
+        os.posix_fallocate(fd, 0, size)
+    else:
+        os.ftruncate(fd, size)
+
+
+class _BufferedDumpWriter:
+    """Buffered dump file writer, optionally syncing every sync_every bytes"""
+
+    def __init__(self, path: str, sync_every: int = 0):
+        self._raw = open(path, "wb", buffering=0)
+        self._f = io.BufferedWriter(self._raw, buffer_size=DUMP_BUFFER_SIZE)
+        self._sync_every = sync_every
+        self._next_sync = sync_every
+        self._reserved = 0
+        self.size = 0
+
+    def preallocate(self, size: int) -> None:
+        _preallocate(self._raw.fileno(), size)
+        self._reserved = size
+
+    def write(self, data) -> None:
+        self._f.write(data)
+        self.size += len(data)
+        if self._sync_every and self.size >= self._next_sync:
+            self._f.flush()
+            os.fsync(self._raw.fileno())
+            self._next_sync = self.size + self._sync_every
+
+    def close(self) -> None:
+        try:
+            self._f.flush()
+            fd = self._raw.fileno()
+            if self._reserved > self.size:
+                os.ftruncate(fd, self.size)
+            os.fsync(fd)
+            # The dump is rarely read back right away; drop it from the page cache
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            self._f.close()
+
+
+class _DirectDumpWriter:
+    """
+    Dump file writer using O_DIRECT (Linux)
+
+    Data is staged in a page-aligned anonymous mmap and written in whole
+    buffers; the tail is zero-padded to DIRECT_IO_ALIGN and the file is
+    truncated to the real size on close (which also drops any preallocation).
+    """
+
+    def __init__(self, path: str):
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+        self._buf = mmap.mmap(-1, DUMP_BUFFER_SIZE)
+        self._mv = memoryview(self._buf)
+        self._fill = 0
+        self.size = 0
+
+    def preallocate(self, size: int) -> None:
+        _preallocate(self._fd, size)
+
+    def write(self, data) -> None:
+        data = memoryview(data)
+        while data:
+            n = min(len(data), DUMP_BUFFER_SIZE - self._fill)
+            self._mv[self._fill : self._fill + n] = data[:n]
+            self._fill += n
+            self.size += n
+            data = data[n:]
+            if self._fill == DUMP_BUFFER_SIZE:
+                self._write_buffer(DUMP_BUFFER_SIZE)
+
+    def _write_buffer(self, length: int) -> None:
+        if os.write(self._fd, self._mv[:length]) != length:
+            raise OSError("Short write on direct I/O dump file")
+        self._fill = 0
+
+    def close(self) -> None:
+        try:
+            if self._fill:
+                padded = -(-self._fill // DIRECT_IO_ALIGN) * DIRECT_IO_ALIGN
+                self._mv[self._fill : padded] = bytes(padded - self._fill)
+                self._write_buffer(padded)
+            os.ftruncate(self._fd, self.size)
+            os.fsync(self._fd)
+        finally:
+            self._mv.release()
+            self._buf.close()
+            os.close(self._fd)
+
 
 class CLIInterface:
     """Command-line interface for NAND operations"""
 
     def __init__(self):
         self.logger = get_logger()
-        self.controller = NANDController()
+        self._controller = None
         self.port = None
+        self._ports_cache = None
+
+    @property
+    def controller(self) -> "NANDController":
+        """NAND controller, created (and pyserial imported) on first use"""
+        if self._controller is None:
+            from ..hardware.nand_controller import NANDController
+
+            self._controller = NANDController()
+        return self._controller
+
+    @controller.setter
+    def controller(self, controller: "NANDController") -> None:
+        self._controller = controller
+
+    def _enum_ports(self, force: bool = False) -> list:
+        """
+        Enumerate serial ports once per CLI command
+
+        comports() can take hundreds of milliseconds on Windows, and a failed
+        auto-detect is followed by a port listing, so the result is shared.
+
+        Args:
+            force: Re-enumerate even if a cached result exists
+
+        Returns:
+            List of port info objects
+        """
+        if force or self._ports_cache is None:
+            # Imported here: the list_ports backend is slow to load on Windows and
+            # commands given an explicit --port never need it
+            import serial.tools.list_ports as stp
+
+            self._ports_cache = list(stp.comports())
+        return self._ports_cache
 
     def auto_detect_port(self) -> str | None:
         """
@@ -33,15 +183,10 @@ class CLIInterface:
         """
         self.logger.info("Auto-detecting Pico COM port...")
 
-        ports = list(serial.tools.list_ports.comports())
+        ports = self._enum_ports()
         for port in ports:
-            # Look for Pico or common identifiers
-            if (
-                "Pico" in port.description
-                or "Serial" in port.description
-                or "UART" in port.description
-                or "CDC" in port.description
-            ):
+            # Raspberry Pi VID first (integer compare), then common identifiers
+            if port.vid == PICO_USB_VID or _PICO_DESCRIPTION_RE.search(port.description):
                 self.logger.info(f"Pico detected on {port.device}")
                 return port.device
 
@@ -51,7 +196,7 @@ class CLIInterface:
     def list_ports(self) -> None:
         """List available serial ports"""
         print("Available serial ports:")
-        ports = list(serial.tools.list_ports.comports())
+        ports = self._enum_ports()
         if not ports:
             print("  No ports available")
             return
@@ -109,35 +254,109 @@ class CLIInterface:
             print("❌ NAND not detected")
             return False
 
-    def read_operation(self, output_file: str) -> bool:
+    @staticmethod
+    def _progress_printer(label: str):
         """
-        Perform read operation
+        Build a progress callback that redraws the status line at most every 50 ms
+
+        The controller may report progress once per page; repeated percentages are
+        skipped and at most ~20 updates per second reach stdout.
+        """
+        last = [0.0, -1]
+        write = sys.stdout.write
+        # Label is formatted once; each update is a single %-substitution of an int
+        line = f"\r{label} progress: %d%%".__mod__
+
+        def progress_callback(progress: int):
+            now = time.monotonic()
+            if progress == last[1] or (now - last[0] < PROGRESS_INTERVAL and progress < 100):
+                return
+            last[0] = now
+            last[1] = progress
+            write(line(progress))
+            sys.stdout.flush()
+
+        return progress_callback
+
+    def _open_dump(self, output_file: str, direct: bool = False):
+        """
+        Open the dump output file
 
         Args:
-                        output_file: Path to save the dump
+            output_file: Path to save the dump
+            direct: Bypass the page cache (O_DIRECT where available, otherwise periodic fsync)
 
-                    Returns:
-                        True if successful, False otherwise"""
+        Returns:
+            Writer with write(data), close() and size
+        """
+        if direct:
+            if hasattr(os, "O_DIRECT"):
+                try:
+                    return _DirectDumpWriter(output_file)
+                except OSError as e:
+                    # e.g. tmpfs and some network filesystems reject O_DIRECT
+                    self.logger.warning(f"Direct I/O unavailable ({e}); using periodic fsync")
+            return _BufferedDumpWriter(output_file, sync_every=DIRECT_SYNC_INTERVAL)
+        return _BufferedDumpWriter(output_file)
+
+    def _preallocate_dump(self, dump) -> None:
+        """
+        Reserve the detected NAND size in the dump file before streaming into it
 
-        def progress_callback(progress: int):
-            print(f"\rRead progress: {progress}%", end="", flush=True)
+        Avoids growing the file extent by extent during a multi-GB read. The
+        size covers the main area only; with OOB enabled the file simply grows
+        past it, and the writer trims any unused reservation on close.
+        """
+        total_size = self.controller.nand_total_size
+        if not total_size:
+            return
+        try:
+            dump.preallocate(total_size)
+        except OSError as e:
+            self.logger.debug(f"Could not preallocate dump file: {e}")
 
-        print(f"Reading NAND to {output_file}...")
-        data = self.controller.read_nand(progress_callback=progress_callback)
+    def read_operation(self, output_file: str, direct: bool = False) -> bool:
+        """
+        Perform read operation
+
+        Args:
+            output_file: Path to save the dump
+            direct: Bypass the page cache while writing the dump
 
-        if data:
-            print(f"\nSaving {len(data)} bytes to {output_file}")
+        Returns:
+            True if successful, False otherwise
+        """
+        progress_callback = self._progress_printer("Read")
+
+        print(f"Reading NAND to {output_file}...")
+        # Pages are streamed straight to disk instead of collecting the whole
+        # image in memory first
+        dump = None
+        existed = os.path.exists(output_file)
+        try:
+            dump = self._open_dump(output_file, direct)
             try:
-                with open(output_file, "wb") as f:
-                    f.write(data)
-                print(f"✅ NAND read completed successfully. Data saved to {output_file}")
-                return True
-            except Exception as e:
-                print(f"❌ Error saving file: {e}")
-                return False
-        else:
-            print("❌ NAND read failed")
-            return False
+                self._preallocate_dump(dump)
+                ok = self.controller.read_nand_stream(
+                    dump.write, progress_callback=progress_callback
+                )
+            finally:
+                dump.close()
+        except Exception as e:
+            print(f"\n❌ Error saving file: {e}")
+            ok = False
+
+        if ok and dump.size:
+            print(f"\nSaved {dump.size} bytes to {output_file}")
+            print(f"✅ NAND read completed successfully. Data saved to {output_file}")
+            return True
+
+        # Do not leave a truncated dump behind, but never delete a file this run
+        # did not open (or create while trying to)
+        if dump is not None or not existed:
+            Path(output_file).unlink(missing_ok=True)
+        print("❌ NAND read failed")
+        return False
 
     def write_operation(self, input_file: str) -> bool:
         """
@@ -153,25 +372,32 @@ class CLIInterface:
             print(f"❌ Input file does not exist: {input_file}")
             return False
 
+        # Map the image instead of reading it into memory; the controller slices
+        # pages out of the memoryview and the OS pages them in on demand
         try:
             with open(input_file, "rb") as f:
-                data = f.read()
-            print(f"Loaded {len(data)} bytes from {input_file}")
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
         except Exception as e:
             print(f"❌ Error reading input file: {e}")
             return False
 
-        # Confirm write operation
-        response = input("⚠️  This will overwrite NAND contents. Continue? (y/N): ")
-        if response.lower() != "y":
-            print("Write operation cancelled")
-            return False
+        data = memoryview(mm)
+        try:
+            print(f"Loaded {len(data)} bytes from {input_file}")
 
-        def progress_callback(progress: int):
-            print(f"\rWrite progress: {progress}%", end="", flush=True)
+            # Confirm write operation
+            response = input("⚠️  This will overwrite NAND contents. Continue? (y/N): ")[:1].lower()
+            if response != "y":
+                print("Write operation cancelled")
+                return False
+
+            progress_callback = self._progress_printer("Write")
 
-        print("Writing data to NAND...")
-        success = self.controller.write_nand(data, progress_callback=progress_callback)
+            print("Writing data to NAND...")
+            success = self.controller.write_nand(data, progress_callback=progress_callback)
+        finally:
+            data.release()
+            mm.close()
 
         if success:
             print("\n✅ NAND write completed successfully")
@@ -183,13 +409,12 @@ class CLIInterface:
     def erase_operation(self) -> bool:
         """Perform erase operation"""
         # Confirm erase operation
-        response = input("⚠️  This will erase all data on NAND. Continue? (y/N): ")
-        if response.lower() != "y":
+        response = input("⚠️  This will erase all data on NAND. Continue? (y/N): ")[:1].lower()
+        if response != "y":
             print("Erase operation cancelled")
             return False
 
-        def progress_callback(progress: int):
-            print(f"\rErase progress: {progress}%", end="", flush=True)
+        progress_callback = self._progress_printer("Erase")
 
         print("Erasing NAND...")
         success = self.controller.erase_nand(progress_callback=progress_callback)
@@ -220,7 +445,7 @@ class CLIInterface:
         # Perform requested operation
         success = False
         if args.command == "read":
-            success = self.read_operation(args.output)
+            success = self.read_operation(args.output, direct=args.direct)
         elif args.command == "write":
             success = self.write_operation(args.input)
         elif args.command == "erase":
@@ -249,6 +474,11 @@ def main():
     # Read command
     read_parser = subparsers.add_parser("read", help="Read NAND content to file")
     read_parser.add_argument("output", type=str, help="Output file path")
+    read_parser.add_argument(
+        "--direct",
+        action="store_true",
+        help="Bypass the OS page cache while writing the dump (O_DIRECT / periodic fsync)",
+    )
 
     # Write command
     write_parser = subparsers.add_parser("write", help="Write file to NAND")
@@ -4,12 +4,32 @@ Handles application settings, defaults, and configuration persistence.
 """
 
 import json
-from dataclasses import asdict, dataclass
+import os
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional: faster encoding, stdlib json otherwise
+    orjson = None
 
-@dataclass
+
+def _dump_json(data: dict) -> bytes:
+    """Serialize settings to indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(slots=True)
 class AppSettings:
     """Application settings dataclass"""
 
@@ -45,10 +65,19 @@ class AppSettings:
     default_dump_extension: str = ".bin"
     max_recent_files: int = 10
 
+    def to_dict(self) -> dict[str, Any]:
+        """Flat dict of the settings (all fields are scalars, so no deep copy as with asdict)"""
+        return {name: getattr(self, name) for name in _SETTING_NAMES}
+
+
+_SETTING_NAMES = tuple(f.name for f in fields(AppSettings))
+
 
 class ConfigManager:
     """Configuration manager for handling persistent settings"""
 
+    _VALID_KEYS = frozenset(_SETTING_NAMES)
+
     def __init__(self, config_path: str | None = None):
         """
         Initialize configuration manager
@@ -71,13 +100,13 @@ class ConfigManager:
         """
         try:
             if self.config_path.exists():
-                with open(self.config_path, encoding="utf-8") as f:
-                    config_data = json.load(f)
+                config_data = _load_json(self.config_path.read_bytes())
 
-                # Update settings with loaded data
-                for key, value in config_data.items():
-                    if hasattr(self.settings, key):
-                        setattr(self.settings, key, value)
+                # Update settings with loaded data; unknown keys are dropped by the
+                # set intersection (AppSettings is slotted, so no __dict__.update)
+                settings = self.settings
+                for key in self._VALID_KEYS.intersection(config_data):
+                    setattr(settings, key, config_data[key])
 
                 return True
             else:
@@ -98,8 +127,11 @@ class ConfigManager:
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(asdict(self.settings), f, indent=2, ensure_ascii=False)
+            # Write the whole file at once and swap it in, so a crash never leaves
+            # a half-written config behind
+            tmp_path = self.config_path.with_suffix(".tmp")
+            tmp_path.write_bytes(_dump_json(self.settings.to_dict()))
+            os.replace(tmp_path, self.config_path)
 
             return True
         except Exception as e:
@@ -119,6 +151,19 @@ class ConfigManager:
         """
         return getattr(self.settings, key, default)
 
+    def get_many(self, keys) -> dict[str, Any]:
+        """
+        Get several configuration values at once
+
+        Args:
+            keys: Iterable of configuration keys
+
+        Returns:
+            Dict of the requested keys that exist, mapped to their values
+        """
+        settings = self.settings
+        return {key: getattr(settings, key) for key in keys if key in self._VALID_KEYS}
+
     def set(self, key: str, value: Any) -> None:
         """
         Set a configuration value
@@ -127,16 +172,54 @@ class ConfigManager:
             key: Configuration key
             value: Configuration value
         """
-        if hasattr(self.settings, key):
+        if key in self._VALID_KEYS:
             setattr(self.settings, key, value)
         else:
             raise AttributeError(f"'{key}' is not a valid configuration setting")
 
+    def update(self, values: dict[str, Any]) -> None:
+        """
+        Set several configuration values at once
+
+        All keys are validated before any value is applied, so an invalid key
+        leaves the settings untouched.
+
+        Args:
+            values: Mapping of configuration keys to values
+        """
+        unknown = values.keys() - self._VALID_KEYS
+        if unknown:
+            raise AttributeError(f"'{sorted(unknown)[0]}' is not a valid configuration setting")
+        settings = self.settings
+        for key, value in values.items():
+            setattr(settings, key, value)
+
     def reset_to_defaults(self) -> None:
         """Reset all settings to default values"""
         self.settings = AppSettings()
         self.save_config()
 
 
-# Global configuration instance
-config_manager = ConfigManager()
+# Global configuration instance, created on first access so that importing this
+# module does not touch the filesystem
+_config_manager: ConfigManager | None = None
+
+
+def get_config_manager() -> ConfigManager:
+    """
+    Get the global configuration manager, loading it on first use
+
+    Returns:
+        Shared ConfigManager instance
+    """
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: keeps `from ..config.settings import config_manager` working
+    if name == "config_manager":
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
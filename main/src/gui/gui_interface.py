@@ -3,23 +3,61 @@ GUI interface for Pico NAND Flasher
 Provides a graphical user interface for NAND operations
 """
 
+import mmap
 import os
+import queue
+import re
 import threading
+import time
 import tkinter as tk
 import tkinter.ttk as ttk
-from tkinter import Tk, filedialog, messagebox
-
-import serial
-import serial.tools.list_ports
+import types
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import Tk, messagebox
 
 from ..config.settings import config_manager
 from ..hardware.nand_controller import NANDController
 from ..utils.exceptions import (
     ConnectionException,
+    OperationAbortedException,
 )
 from ..utils.i18n import i18n
 from ..utils.logging_config import get_logger
 
+# Minimum seconds between progress bar redraws
+PROGRESS_INTERVAL = 0.05
+# Progress label texts, built once
+_PCT_STRINGS = tuple(f"{i}%" for i in range(101))
+# Interval of the main-thread loop draining worker UI requests (ms)
+UI_PUMP_INTERVAL_MS = 30
+# Seconds a serial port enumeration is reused by repeated Connect clicks
+PORTS_CACHE_TTL = 2.0
+# Write buffer for streamed read dumps
+DUMP_BUFFER_SIZE = 1 << 20
+# Settings changes within this window (ms) are written to disk once
+SAVE_DEBOUNCE_MS = 300
+# Serial write timeout (s) applied after connecting
+SERIAL_WRITE_TIMEOUT = 5
+# Port descriptions that identify a Pico or a common USB-UART bridge
+_PORT_RE = re.compile(r"Pico|Serial|UART|CP210|CH340|FTDI", re.IGNORECASE)
+
+# Translation keys used by the GUI, resolved once per language into NANDFlasherGUI._T
+_STRING_KEYS = """
+binary_protocol cancel_button clear_resume confirm_erase_text confirm_erase_title
+confirm_read_text confirm_read_title confirm_write_text confirm_write_title connect_button
+connection connection_error connection_error_title connection_failed
+connection_manual_select connection_title disconnect_button english erase_completed
+erase_failed erasing_nand error_title file_operations language language_applied
+nand_information nand_not_detected nand_operations_erase nand_operations_read
+nand_operations_write no_file_selected no_nand_detected not_connected_to_pico
+operation_cancelled operations operations_select_dump please_select_dump
+protocol_change_notice read_completed read_failed reading_nand ready resume_cleared
+resume_erase_text resume_found_title resume_mode_erase resume_mode_read resume_mode_write
+resume_read_text resume_write_text russian save_dump_title select_dump_title settings
+status_connected status_disconnected success_title title warning_title write_completed
+write_failed writing_nand
+""".split()
+
 
 class NANDFlasherGUI:
     """Main GUI class for NAND Flasher operations"""
@@ -37,10 +75,11 @@ class NANDFlasherGUI:
                 i18n.set_language(lang)
         except Exception:
             pass
+        self._reload_strings()
 
         title = "Pico NAND Flasher"
         if i18n:
-            title = i18n.t("title") or title
+            title = self._T.title or title
         self.root.title(title)
         self.root.geometry("800x600")
 
@@ -49,9 +88,47 @@ class NANDFlasherGUI:
         self.selected_operation = ""
         self.is_connected = False
         self.is_operation_running = False
+        # Progress coalescing: workers report per page, Tk redraws at ~20 Hz
+        self._last_pct = -1
+        self._last_ts = 0.0
+        self._pending_pct = 0
+        self._progress_scheduled = False
+        # Detected NAND size in MB by model name
+        self._size_cache: dict[str, int] = {}
+        # Last serial port enumeration and when it was taken
+        self._ports_cache: list = []
+        self._ports_ts = 0.0
+        # Tk is not thread-safe: workers post (action, payload) here and
+        # _pump applies them on the main thread
+        self._ui_q: queue.Queue = queue.Queue()
+        self._ui_handlers = {
+            "status": lambda text: self.status_label.config(text=text),
+            "info": lambda args: messagebox.showinfo(*args),
+            "error": lambda args: messagebox.showerror(*args),
+            "running": self.set_operation_running,
+            "progress": lambda _: self._apply_progress(),
+            "reset_progress": lambda _: self._reset_progress(),
+        }
+
+        # Pending debounced config save (root.after id)
+        self._save_job = None
+        # One reusable worker thread runs all NAND operations; the Future of the
+        # current one is kept for reference
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nand-op")
+        self._current_fut = None
+        # Read-only mapping of the selected dump, reused across write retries.
+        # Shared by the Tk and worker threads, so guarded by _dump_lock; while a
+        # write uses it, releasing is deferred until the write returns
+        self._dump_lock = threading.Lock()
+        self._dump_mmap = None
+        self._dump_fp = None
+        self._dump_busy = False
+        self._dump_release_pending = False
 
         # Create GUI elements
         self.create_widgets()
+        # Persist any pending settings change on close
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Setup logging
         self.logger.info("GUI initialized")
@@ -63,165 +140,110 @@ class NANDFlasherGUI:
         settings_menu = tk.Menu(menubar, tearoff=0)
         # Language submenu
         lang_menu = tk.Menu(settings_menu, tearoff=0)
-        lang_menu.add_command(label=i18n.t("english"), command=lambda: self._set_language("en"))
-        lang_menu.add_command(label=i18n.t("russian"), command=lambda: self._set_language("ru"))
-        settings_menu.add_cascade(label=i18n.t("language"), menu=lang_menu)
+        lang_menu.add_command(label=self._T.english, command=lambda: self._set_language("en"))
+        lang_menu.add_command(label=self._T.russian, command=lambda: self._set_language("ru"))
+        settings_menu.add_cascade(label=self._T.language, menu=lang_menu)
+        # Menu entries labelled with a translation: (menu, index, key)
+        menu_entries = [
+            (lang_menu, 0, "english"),
+            (lang_menu, 1, "russian"),
+            (settings_menu, settings_menu.index("end"), "language"),
+        ]
         # Binary protocol toggle
         self.binary_var = tk.BooleanVar(value=bool(config_manager.get("use_binary_protocol", True)))
-
-        def _toggle_protocol():
-            try:
-                config_manager.set("use_binary_protocol", bool(self.binary_var.get()))
-                config_manager.save_config()
-                messagebox.showinfo(i18n.t("settings"), i18n.t("protocol_change_notice"))
-            except Exception:
-                pass
-
         settings_menu.add_checkbutton(
-            label=i18n.t("binary_protocol"),
+            label=self._T.binary_protocol,
             onvalue=True,
             offvalue=False,
             variable=self.binary_var,
-            command=_toggle_protocol,
+            command=self._toggle_protocol,
         )
+        menu_entries.append((settings_menu, settings_menu.index("end"), "binary_protocol"))
 
         # Include OOB toggle
         self.oob_var = tk.BooleanVar(value=bool(config_manager.get("include_oob", False)))
-
-        def _toggle_oob():
-            try:
-                config_manager.set("include_oob", bool(self.oob_var.get()))
-                config_manager.save_config()
-                messagebox.showinfo(i18n.t("settings"), "OOB setting saved")
-            except Exception:
-                pass
-
         settings_menu.add_checkbutton(
             label="Include OOB in dumps",
             onvalue=True,
             offvalue=False,
             variable=self.oob_var,
-            command=_toggle_oob,
+            command=self._toggle_oob,
         )
 
         # Enable ECC toggle
         self.ecc_var = tk.BooleanVar(value=bool(config_manager.get("enable_ecc", False)))
-
-        def _toggle_ecc():
-            try:
-                config_manager.set("enable_ecc", bool(self.ecc_var.get()))
-                config_manager.save_config()
-                messagebox.showinfo(i18n.t("settings"), "ECC setting saved")
-            except Exception:
-                pass
-
         settings_menu.add_checkbutton(
             label="Enable ECC verification",
             onvalue=True,
             offvalue=False,
             variable=self.ecc_var,
-            command=_toggle_ecc,
+            command=self._toggle_ecc,
         )
 
         # ECC parameters dialog
-        def _open_ecc_params():
-            win = tk.Toplevel(self.root)
-            win.title("ECC Parameters")
-            tk.Label(win, text="ECC scheme (none|crc16|hamming_512_3byte)").grid(
-                row=0, column=0, sticky="w"
-            )
-            scheme_var = tk.StringVar(value=str(config_manager.get("ecc_scheme", "crc16")))
-            tk.Entry(win, textvariable=scheme_var).grid(row=0, column=1)
-            tk.Label(win, text="ECC sector size").grid(row=1, column=0, sticky="w")
-            sector_var = tk.StringVar(value=str(config_manager.get("ecc_sector_size", 512)))
-            tk.Entry(win, textvariable=sector_var).grid(row=1, column=1)
-            tk.Label(win, text="ECC bytes per sector").grid(row=2, column=0, sticky="w")
-            bytes_var = tk.StringVar(value=str(config_manager.get("ecc_bytes_per_sector", 2)))
-            tk.Entry(win, textvariable=bytes_var).grid(row=2, column=1)
-            tk.Label(win, text="ECC OOB offset").grid(row=3, column=0, sticky="w")
-            oob_off_var = tk.StringVar(value=str(config_manager.get("ecc_oob_offset", 0)))
-            tk.Entry(win, textvariable=oob_off_var).grid(row=3, column=1)
-
-            def _save():
-                try:
-                    config_manager.set("ecc_scheme", scheme_var.get())
-                    config_manager.set("ecc_sector_size", int(sector_var.get()))
-                    config_manager.set("ecc_bytes_per_sector", int(bytes_var.get()))
-                    config_manager.set("ecc_oob_offset", int(oob_off_var.get()))
-                    config_manager.save_config()
-                    messagebox.showinfo("ECC", "ECC parameters saved")
-                    win.destroy()
-                except Exception as e:
-                    messagebox.showerror("ECC", f"Error saving ECC params: {e}")
-
-            tk.Button(win, text="Save", command=_save).grid(row=4, column=0, columnspan=2)
-
-        settings_menu.add_command(label="ECC Parameters…", command=_open_ecc_params)
+        settings_menu.add_command(label="ECC Parameters…", command=self._open_ecc_params)
 
         # Clear resume state
-        def _clear_resume():
-            try:
-                self.controller.clear_resume_state()
-                messagebox.showinfo(i18n.t("settings"), i18n.t("resume_cleared"))
-            except Exception:
-                pass
-
-        settings_menu.add_command(label=i18n.t("clear_resume"), command=_clear_resume)
-        menubar.add_cascade(label=i18n.t("settings"), menu=settings_menu)
+        settings_menu.add_command(label=self._T.clear_resume, command=self._clear_resume)
+        menu_entries.append((settings_menu, settings_menu.index("end"), "clear_resume"))
+        menubar.add_cascade(label=self._T.settings, menu=settings_menu)
+        menu_entries.append((menubar, menubar.index("end"), "settings"))
         self.root.config(menu=menubar)
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
         # Connection frame
-        conn_label = i18n.t("connection")
+        conn_label = self._T.connection
         conn_frame = ttk.LabelFrame(main_frame, text=conn_label, padding="5")
         conn_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
 
-        btn_connect = i18n.t("connect_button")
-        btn_disconnect = i18n.t("disconnect_button")
-        status_disconnected = i18n.t("status_disconnected")
-        ttk.Button(conn_frame, text=btn_connect, command=self.connect).grid(row=0, column=0, padx=5)
-        ttk.Button(conn_frame, text=btn_disconnect, command=self.disconnect).grid(
-            row=0, column=1, padx=5
-        )
+        btn_connect = self._T.connect_button
+        btn_disconnect = self._T.disconnect_button
+        status_disconnected = self._T.status_disconnected
+        connect_btn = ttk.Button(conn_frame, text=btn_connect, command=self.connect)
+        connect_btn.grid(row=0, column=0, padx=5)
+        disconnect_btn = ttk.Button(conn_frame, text=btn_disconnect, command=self.disconnect)
+        disconnect_btn.grid(row=0, column=1, padx=5)
         self.conn_status_label = ttk.Label(conn_frame, text=status_disconnected)
         self.conn_status_label.grid(row=0, column=2, padx=10)
 
         # NAND info frame
-        nand_frame = ttk.LabelFrame(main_frame, text=i18n.t("nand_information"), padding="5")
+        nand_frame = ttk.LabelFrame(main_frame, text=self._T.nand_information, padding="5")
         nand_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
 
-        self.nand_info_label = ttk.Label(nand_frame, text=i18n.t("nand_not_detected"))
+        self.nand_info_label = ttk.Label(nand_frame, text=self._T.nand_not_detected)
         self.nand_info_label.grid(row=0, column=0, sticky=tk.W)
 
         # File operations frame
-        file_frame = ttk.LabelFrame(main_frame, text=i18n.t("file_operations"), padding="5")
+        file_frame = ttk.LabelFrame(main_frame, text=self._T.file_operations, padding="5")
         file_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
 
-        btn_select_dump = i18n.t("operations_select_dump")
-        ttk.Button(file_frame, text=btn_select_dump, command=self.select_dump).grid(
-            row=0, column=0, padx=5
-        )
-        self.dump_label = ttk.Label(file_frame, text=i18n.t("no_file_selected"))
+        btn_select_dump = self._T.operations_select_dump
+        select_dump_btn = ttk.Button(file_frame, text=btn_select_dump, command=self.select_dump)
+        select_dump_btn.grid(row=0, column=0, padx=5)
+        self.dump_label = ttk.Label(file_frame, text=self._T.no_file_selected)
         self.dump_label.grid(row=0, column=1, padx=5, sticky=tk.W)
 
         # Operations frame
-        op_frame = ttk.LabelFrame(main_frame, text=i18n.t("operations"), padding="5")
+        op_frame = ttk.LabelFrame(main_frame, text=self._T.operations, padding="5")
         op_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
 
-        btn_read = i18n.t("nand_operations_read")
-        btn_write = i18n.t("nand_operations_write")
-        btn_erase = i18n.t("nand_operations_erase")
-        ttk.Button(op_frame, text=btn_read, command=self.read_nand).grid(
-            row=0, column=0, padx=5, pady=2
-        )
-        ttk.Button(op_frame, text=btn_write, command=self.write_nand).grid(
-            row=0, column=1, padx=5, pady=2
-        )
-        ttk.Button(op_frame, text=btn_erase, command=self.erase_nand).grid(
-            row=0, column=2, padx=5, pady=2
+        btn_read = self._T.nand_operations_read
+        btn_write = self._T.nand_operations_write
+        btn_erase = self._T.nand_operations_erase
+        self.read_btn = ttk.Button(op_frame, text=btn_read, command=self.read_nand)
+        self.read_btn.grid(row=0, column=0, padx=5, pady=2)
+        self.write_btn = ttk.Button(op_frame, text=btn_write, command=self.write_nand)
+        self.write_btn.grid(row=0, column=1, padx=5, pady=2)
+        self.erase_btn = ttk.Button(op_frame, text=btn_erase, command=self.erase_nand)
+        self.erase_btn.grid(row=0, column=2, padx=5, pady=2)
+        self.cancel_btn = ttk.Button(
+            op_frame, text=self._T.cancel_button, command=self.cancel_operation, state="disabled"
         )
+        self.cancel_btn.grid(row=0, column=3, padx=5, pady=2)
+        # Buttons disabled while an operation runs
+        self._op_buttons = [self.read_btn, self.write_btn, self.erase_btn]
 
         # Progress bar
         progress_frame = ttk.Frame(main_frame)
@@ -230,83 +252,279 @@ class NANDFlasherGUI:
         self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(progress_frame, variable=self.progress_var, maximum=100)
         self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=5)
-        self.progress_label = ttk.Label(progress_frame, text=i18n.t("ready"))
+        self.progress_label = ttk.Label(progress_frame, text=self._T.ready)
         self.progress_label.grid(row=0, column=1, padx=5)
 
         # Status frame
         status_frame = ttk.Frame(main_frame)
         status_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
 
-        self.status_label = ttk.Label(status_frame, text=i18n.t("ready"))
+        self.status_label = ttk.Label(status_frame, text=self._T.ready)
         self.status_label.grid(row=0, column=0, sticky=tk.W)
         # Resume status label
         self.resume_label = ttk.Label(status_frame, text="")
         self.resume_label.grid(row=0, column=1, sticky=tk.W, padx=10)
 
+        # Everything _retranslate() refreshes on a language switch
+        self._i18n_menu_entries = menu_entries
+        self._i18n_widgets = [
+            (conn_frame, "connection"),
+            (connect_btn, "connect_button"),
+            (disconnect_btn, "disconnect_button"),
+            (nand_frame, "nand_information"),
+            (file_frame, "file_operations"),
+            (select_dump_btn, "operations_select_dump"),
+            (op_frame, "operations"),
+            (self.read_btn, "nand_operations_read"),
+            (self.write_btn, "nand_operations_write"),
+            (self.erase_btn, "nand_operations_erase"),
+            (self.cancel_btn, "cancel_button"),
+        ]
+
         # Configure grid weights
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
 
+    def _toggle_protocol(self):
+        try:
+            config_manager.set("use_binary_protocol", bool(self.binary_var.get()))
+            self._schedule_save()
+            messagebox.showinfo(self._T.settings, self._T.protocol_change_notice)
+        except Exception:
+            pass
+
+    def _toggle_oob(self):
+        try:
+            config_manager.set("include_oob", bool(self.oob_var.get()))
+            self._schedule_save()
+            messagebox.showinfo(self._T.settings, "OOB setting saved")
+        except Exception:
+            pass
+
+    def _toggle_ecc(self):
+        try:
+            config_manager.set("enable_ecc", bool(self.ecc_var.get()))
+            self._schedule_save()
+            messagebox.showinfo(self._T.settings, "ECC setting saved")
+        except Exception:
+            pass
+
+    def _open_ecc_params(self):
+        """Show the ECC parameters dialog"""
+        win = tk.Toplevel(self.root)
+        win.title("ECC Parameters")
+        vals = config_manager.get_many(
+            ("ecc_scheme", "ecc_sector_size", "ecc_bytes_per_sector", "ecc_oob_offset")
+        )
+        tk.Label(win, text="ECC scheme (none|crc16|hamming_512_3byte)").grid(
+            row=0, column=0, sticky="w"
+        )
+        scheme_var = tk.StringVar(value=vals.get("ecc_scheme", "crc16"))
+        tk.Entry(win, textvariable=scheme_var).grid(row=0, column=1)
+        tk.Label(win, text="ECC sector size").grid(row=1, column=0, sticky="w")
+        sector_var = tk.StringVar(value=vals.get("ecc_sector_size", 512))
+        tk.Entry(win, textvariable=sector_var).grid(row=1, column=1)
+        tk.Label(win, text="ECC bytes per sector").grid(row=2, column=0, sticky="w")
+        bytes_var = tk.StringVar(value=vals.get("ecc_bytes_per_sector", 2))
+        tk.Entry(win, textvariable=bytes_var).grid(row=2, column=1)
+        tk.Label(win, text="ECC OOB offset").grid(row=3, column=0, sticky="w")
+        oob_off_var = tk.StringVar(value=vals.get("ecc_oob_offset", 0))
+        tk.Entry(win, textvariable=oob_off_var).grid(row=3, column=1)
+        win.vars = {
+            "ecc_scheme": scheme_var,
+            "ecc_sector_size": sector_var,
+            "ecc_bytes_per_sector": bytes_var,
+            "ecc_oob_offset": oob_off_var,
+        }
+
+        tk.Button(win, text="Save", command=lambda w=win: self._ecc_save(w)).grid(
+            row=4, column=0, columnspan=2
+        )
+
+    def _ecc_save(self, win):
+        """Apply the values entered in the ECC parameters dialog"""
+        fields = win.vars
+        # Parse everything first so a bad field leaves the settings untouched
+        try:
+            values = {
+                "ecc_scheme": fields["ecc_scheme"].get(),
+                "ecc_sector_size": int(fields["ecc_sector_size"].get()),
+                "ecc_bytes_per_sector": int(fields["ecc_bytes_per_sector"].get()),
+                "ecc_oob_offset": int(fields["ecc_oob_offset"].get()),
+            }
+        except ValueError as e:
+            messagebox.showerror("ECC", f"Invalid number: {e}")
+            return
+        try:
+            config_manager.update(values)
+            self._schedule_save()
+            messagebox.showinfo("ECC", "ECC parameters saved")
+            win.destroy()
+        except Exception as e:
+            messagebox.showerror("ECC", f"Error saving ECC params: {e}")
+
+    def _clear_resume(self):
+        try:
+            self.controller.clear_resume_state()
+            messagebox.showinfo(self._T.settings, self._T.resume_cleared)
+        except Exception:
+            pass
+
+    def _reload_strings(self):
+        """Resolve all GUI strings for the current language"""
+        self._T = types.SimpleNamespace(**{key: i18n.t(key) for key in _STRING_KEYS})
+        # Resume label per operation: (template, resume-state key, template field)
+        self._resume_tmpl = {
+            "READ": (self._T.resume_mode_read, "last_page", "page"),
+            "WRITE": (self._T.resume_mode_write, "bytes_sent", "bytes"),
+            "ERASE": (self._T.resume_mode_erase, "erase_block", "block"),
+        }
+
+    def _schedule_save(self):
+        """Save the configuration after SAVE_DEBOUNCE_MS, collapsing rapid changes"""
+        if self._save_job:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(SAVE_DEBOUNCE_MS, self._do_save)
+
+    def _do_save(self):
+        self._save_job = None
+        config_manager.save_config()
+
+    def _flush_save(self):
+        """Write a pending debounced save immediately"""
+        if self._save_job:
+            self.root.after_cancel(self._save_job)
+            self._do_save()
+
+    def _on_close(self):
+        self._flush_save()
+        if self.is_operation_running:
+            self.controller.request_abort()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._release_dump_map()
+        self.root.destroy()
+
+    def _retranslate(self):
+        """Reload strings and relabel widgets in place for the current language"""
+        self._reload_strings()
+        T = vars(self._T)
+        for widget, key in self._i18n_widgets:
+            widget.configure(text=T[key])
+        for menu, index, key in self._i18n_menu_entries:
+            menu.entryconfigure(index, label=T[key])
+        # Idle-state texts; anything else is replaced by the next status update
+        if not self.is_connected:
+            self.conn_status_label.config(text=self._T.status_disconnected)
+            self.nand_info_label.config(text=self._T.nand_not_detected)
+        if not self.selected_dump_path:
+            self.dump_label.config(text=self._T.no_file_selected)
+        if not self.is_operation_running:
+            self.progress_label.config(text=self._T.ready)
+
     def _set_language(self, lang_code: str):
         try:
             i18n.set_language(lang_code)
+            self._retranslate()
             # Persist to config
             config_manager.set("default_language", lang_code.upper())
-            config_manager.save_config()
-            messagebox.showinfo(i18n.t("settings"), i18n.t("language_applied"))
+            self._schedule_save()
+            messagebox.showinfo(self._T.settings, self._T.language_applied)
         except Exception:
             pass
 
+    def _list_ports_cached(self) -> list:
+        """Enumerate serial ports, reusing the result for PORTS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if now - self._ports_ts < PORTS_CACHE_TTL:
+            return self._ports_cache
+        # Imported on first use: the list_ports backend is slow to load on Windows
+        import serial.tools.list_ports as list_ports
+
+        self._ports_cache = list(list_ports.comports())
+        self._ports_ts = now
+        return self._ports_cache
+
+    def _apply_low_latency(self, port: str):
+        """
+        Minimise USB-serial turnaround for the connected port (best effort)
+
+        Linux defaults to a 16 ms latency timer on USB-serial adapters, which
+        caps request/response round-trips during NAND transfers.
+        """
+        ser = self.controller.ser
+        if ser is None:
+            return
+        try:
+            ser.inter_byte_timeout = None
+            ser.write_timeout = SERIAL_WRITE_TIMEOUT
+        except Exception as e:
+            self.logger.debug(f"Could not adjust serial timeouts: {e}")
+        if os.name != "posix":
+            return
+        # ASYNC_LOW_LATENCY via TIOCSSERIAL (what `setserial <dev> low_latency` does)
+        try:
+            ser.set_low_latency_mode(True)
+        except (AttributeError, ValueError, OSError) as e:
+            self.logger.debug(f"Low-latency mode unavailable on {port}: {e}")
+        # FTDI-style adapters expose the latency timer in sysfs
+        timer = f"/sys/bus/usb-serial/devices/{os.path.basename(port)}/latency_timer"
+        try:
+            with open(timer, "w") as f:
+                f.write("1")
+        except OSError:
+            pass
+
     def connect(self):
         """Connect to the Pico device"""
         self.logger.info("Attempting to connect to Pico...")
 
         # Try to auto-detect port
-        ports = list(serial.tools.list_ports.comports())
-        pico_port = None
-        for port in ports:
-            if (
-                "Pico" in port.description
-                or "Serial" in port.description
-                or "UART" in port.description
-            ):
-                pico_port = port.device
-                break
+        ports = self._list_ports_cached()
+        pico_port = next(
+            (p.device for p in ports if p.description and _PORT_RE.search(p.description)),
+            None,
+        )
 
         if not pico_port:
             # If auto-detect fails, ask user
-            messagebox.showinfo(i18n.t("connection_title"), i18n.t("connection_manual_select"))
+            messagebox.showinfo(self._T.connection_title, self._T.connection_manual_select)
             return
 
         try:
             if self.controller.connect(pico_port):
                 self.is_connected = True
+                self._apply_low_latency(pico_port)
                 self.conn_status_label.config(text=f"Connected to {pico_port}")
-                self.status_label.config(text=i18n.t("status_connected"))
+                self.status_label.config(text=self._T.status_connected)
 
                 # Try to detect NAND
                 self.detect_nand()
             else:
-                messagebox.showerror(i18n.t("connection_error_title"), i18n.t("connection_failed"))
-                self.conn_status_label.config(text=i18n.t("connection_failed"))
+                messagebox.showerror(self._T.connection_error_title, self._T.connection_failed)
+                self.conn_status_label.config(text=self._T.connection_failed)
         except ConnectionException as e:
             self.logger.error(f"Connection failed: {e}")
-            messagebox.showerror(i18n.t("connection_error_title"), i18n.t("connection_failed"))
-            self.conn_status_label.config(text=i18n.t("connection_failed"))
+            self._ports_ts = 0.0
+            messagebox.showerror(self._T.connection_error_title, self._T.connection_failed)
+            self.conn_status_label.config(text=self._T.connection_failed)
         except Exception as e:
             self.logger.error(f"Unexpected error during connection: {e}")
-            messagebox.showerror(i18n.t("connection_error_title"), i18n.t("connection_error"))
-            self.conn_status_label.config(text=i18n.t("connection_error"))
+            messagebox.showerror(self._T.connection_error_title, self._T.connection_error)
+            self.conn_status_label.config(text=self._T.connection_error)
 
     def disconnect(self):
         """Disconnect from the Pico device"""
+        # Devices may be replugged after disconnecting; enumerate again next time
+        self._ports_ts = 0.0
+        self._flush_save()
+        self._release_dump_map()
         if self.is_connected:
             self.controller.disconnect()
             self.is_connected = False
-            self.conn_status_label.config(text=i18n.t("status_disconnected"))
-            self.nand_info_label.config(text=i18n.t("nand_not_detected"))
-            self.status_label.config(text=i18n.t("status_disconnected"))
+            self.conn_status_label.config(text=self._T.status_disconnected)
+            self.nand_info_label.config(text=self._T.nand_not_detected)
+            self.status_label.config(text=self._T.status_disconnected)
             self.logger.info("Disconnected from Pico")
 
     def detect_nand(self):
@@ -318,59 +536,59 @@ class NANDFlasherGUI:
         if detected and model:
             info_text = f"NAND: {model}"
             if info:
-                info_text += (
-                    f" ({info['page_size']*info['block_size']*info['blocks']//(1024*1024)} MB)"
-                )
+                size_mb = self._size_cache.get(model)
+                if size_mb is None:
+                    size_mb = info["page_size"] * info["block_size"] * info["blocks"] >> 20
+                    self._size_cache[model] = size_mb
+                info_text += f" ({size_mb} MB)"
             self.nand_info_label.config(text=info_text)
             self.status_label.config(text=f"NAND detected: {model}")
             self.logger.info(f"NAND detected: {model}")
             # Show resume mode if exists
             try:
                 resume = self.controller.get_resume_state()
-                op = resume.get("operation")
-                if op == "READ":
-                    self.resume_label.config(
-                        text=i18n.t("resume_mode_read").replace(
-                            "{page}", str(resume.get("last_page", 0))
-                        )
-                    )
-                elif op == "WRITE":
-                    self.resume_label.config(
-                        text=i18n.t("resume_mode_write").replace(
-                            "{bytes}", str(resume.get("bytes_sent", 0))
-                        )
-                    )
-                elif op == "ERASE":
-                    self.resume_label.config(
-                        text=i18n.t("resume_mode_erase").replace(
-                            "{block}", str(resume.get("erase_block", 0))
-                        )
-                    )
+                entry = self._resume_tmpl.get(resume.get("operation"))
+                if entry:
+                    template, state_key, placeholder = entry
+                    text = template.format_map({placeholder: resume.get(state_key, 0)})
                 else:
-                    self.resume_label.config(text="")
+                    text = ""
+                self.resume_label.config(text=text)
             except Exception:
                 self.resume_label.config(text="")
         else:
-            self.nand_info_label.config(text=i18n.t("nand_not_detected"))
-            self.status_label.config(text=i18n.t("nand_not_detected"))
+            self.nand_info_label.config(text=self._T.nand_not_detected)
+            self.status_label.config(text=self._T.nand_not_detected)
             self.resume_label.config(text="")
 
     def select_dump(self):
         """Select a dump file"""
+        from tkinter import filedialog
+
         file_path = filedialog.askopenfilename(
-            title=i18n.t("select_dump_title"),
+            title=self._T.select_dump_title,
             filetypes=[("Binary files", "*.bin"), ("All files", "*.*")],
         )
 
-        if file_path:
-            self.selected_dump_path = file_path
-            self.dump_label.config(text=os.path.basename(file_path))
-            self.logger.info(f"Selected dump file: {file_path}")
+        if not file_path:
+            return
+        try:
+            os.stat(file_path)
+        except OSError as e:
+            messagebox.showerror(self._T.error_title, str(e))
+            return
+
+        self.selected_dump_path = file_path
+        self._release_dump_map()
+        self.dump_label.config(text=os.path.basename(file_path))
+        self.logger.info(f"Selected dump file: {file_path}")
 
     def save_dump(self) -> str | None:
         """Prompt to save dump file"""
+        from tkinter import filedialog
+
         file_path = filedialog.asksaveasfilename(
-            title=i18n.t("save_dump_title"),
+            title=self._T.save_dump_title,
             defaultextension=".bin",
             filetypes=[("Binary files", "*.bin"), ("All files", "*.*")],
         )
@@ -383,34 +601,68 @@ class NANDFlasherGUI:
         return file_path
 
     def update_progress(self, value: int):
-        """Update progress bar and label"""
-        self.progress_var.set(value)
-        self.progress_label.config(text=f"{value}%")
-        self.root.update_idletasks()
+        """
+        Update progress bar and label
+
+        Called from worker threads, possibly once per page. Repeated percentages
+        and updates within PROGRESS_INTERVAL are dropped; the rest overwrite a
+        pending value that the UI pump applies, so redraws never queue up.
+        """
+        pct = int(value)
+        now = time.monotonic()
+        if pct == self._last_pct or (now - self._last_ts < PROGRESS_INTERVAL and pct < 100):
+            return
+        self._last_pct = pct
+        self._last_ts = now
+        self._pending_pct = pct
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self._ui_q.put(("progress", None))
+
+    def _pump(self):
+        """Apply UI requests posted by worker threads (main thread)"""
+        while True:
+            try:
+                op, arg = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                self._ui_handlers[op](arg)
+            except Exception as e:
+                self.logger.error(f"UI update '{op}' failed: {e}")
+        self.root.after(UI_PUMP_INTERVAL_MS, self._pump)
+
+    def _apply_progress(self):
+        """Apply the latest pending progress value (main thread)"""
+        self._progress_scheduled = False
+        pct = self._pending_pct
+        self.progress_var.set(pct)
+        self.progress_label.config(text=_PCT_STRINGS[pct] if 0 <= pct <= 100 else f"{pct}%")
+
+    def _reset_progress(self):
+        """Reset progress display after an operation (main thread)"""
+        self._last_pct = -1
+        self.progress_var.set(0)
+        self.progress_label.config(text=self._T.ready)
 
     def set_operation_running(self, running: bool):
         """Set operation running state and update UI accordingly"""
         self.is_operation_running = running
 
         # Disable/enable buttons based on operation state
-        for child in self.root.winfo_children():
-            for widget in child.winfo_children():
-                if isinstance(widget, ttk.Button):
-                    if running:
-                        if widget.cget("text") in ["Read NAND", "Write NAND", "Erase NAND"]:
-                            widget.config(state="disabled")
-                    else:
-                        if widget.cget("text") in ["Read NAND", "Write NAND", "Erase NAND"]:
-                            widget.config(state="normal")
+        state = "disabled" if running else "normal"
+        for button in self._op_buttons:
+            button.config(state=state)
+        self.cancel_btn.config(state="normal" if running else "disabled")
 
     def read_nand(self):
         """Start NAND read operation"""
         if not self.is_connected:
-            messagebox.showerror(i18n.t("error_title"), i18n.t("not_connected_to_pico"))
+            messagebox.showerror(self._T.error_title, self._T.not_connected_to_pico)
             return
 
         if not self.controller.current_nand_info:
-            messagebox.showwarning(i18n.t("warning_title"), i18n.t("no_nand_detected"))
+            messagebox.showwarning(self._T.warning_title, self._T.no_nand_detected)
             return
 
         # Ask for save location
@@ -419,7 +671,7 @@ class NANDFlasherGUI:
             return
 
         # Confirm operation
-        if not messagebox.askyesno(i18n.t("confirm_read_title"), i18n.t("confirm_read_text")):
+        if not messagebox.askyesno(self._T.confirm_read_title, self._T.confirm_read_text):
             return
 
         # Resume prompt (if applicable)
@@ -427,54 +679,42 @@ class NANDFlasherGUI:
             resume = self.controller.get_resume_state()
             if resume.get("operation") == "READ":
                 if not messagebox.askyesno(
-                    i18n.t("resume_found_title"), i18n.t("resume_read_text")
+                    self._T.resume_found_title, self._T.resume_read_text
                 ):
                     self.controller.clear_resume_state()
         except Exception:
             pass
 
-        # Start operation in separate thread
+        # Start operation on the worker thread
         self.set_operation_running(True)
-        self.status_label.config(text=i18n.t("reading_nand"))
+        self.status_label.config(text=self._T.reading_nand)
 
-        def read_thread():
-            try:
-                data = self.controller.read_nand(progress_callback=self.update_progress)
-                if data:
-                    with open(save_path, "wb") as f:
-                        f.write(data)
-                    self.status_label.config(text=i18n.t("read_completed"))
-                    messagebox.showinfo(i18n.t("success_title"), i18n.t("read_completed"))
-                else:
-                    self.status_label.config(text=i18n.t("read_failed"))
-                    messagebox.showerror(i18n.t("error_title"), i18n.t("read_failed"))
-            except Exception as e:
-                self.logger.error(f"Error during read operation: {e}")
-                self.status_label.config(text=i18n.t("read_failed"))
-                messagebox.showerror(i18n.t("error_title"), i18n.t("read_failed"))
-            finally:
-                self.set_operation_running(False)
-                self.progress_var.set(0)
-                self.progress_label.config(text=i18n.t("ready"))
-
-        threading.Thread(target=read_thread, daemon=True).start()
+        self._submit("read", self._run_read, save_path)
 
     def write_nand(self):
         """Start NAND write operation"""
         if not self.is_connected:
-            messagebox.showerror(i18n.t("error_title"), i18n.t("not_connected_to_pico"))
+            messagebox.showerror(self._T.error_title, self._T.not_connected_to_pico)
             return
 
         if not self.controller.current_nand_info:
-            messagebox.showwarning(i18n.t("warning_title"), i18n.t("no_nand_detected"))
+            messagebox.showwarning(self._T.warning_title, self._T.no_nand_detected)
             return
 
-        if not self.selected_dump_path or not os.path.exists(self.selected_dump_path):
-            messagebox.showerror(i18n.t("error_title"), i18n.t("please_select_dump"))
+        if not self.selected_dump_path:
+            messagebox.showerror(self._T.error_title, self._T.please_select_dump)
+            return
+        # Open the dump up front rather than checking that it exists; the
+        # worker maps this handle, so nothing can swap the file in between
+        try:
+            dump_file = open(self.selected_dump_path, "rb")
+        except OSError:
+            messagebox.showerror(self._T.error_title, self._T.please_select_dump)
             return
 
         # Confirm operation
-        if not messagebox.askyesno(i18n.t("confirm_write_title"), i18n.t("confirm_write_text")):
+        if not messagebox.askyesno(self._T.confirm_write_title, self._T.confirm_write_text):
+            dump_file.close()
             return
 
         # Resume prompt (if applicable)
@@ -482,43 +722,22 @@ class NANDFlasherGUI:
             resume = self.controller.get_resume_state()
             if resume.get("operation") == "WRITE":
                 if not messagebox.askyesno(
-                    i18n.t("resume_found_title"), i18n.t("resume_write_text")
+                    self._T.resume_found_title, self._T.resume_write_text
                 ):
                     self.controller.clear_resume_state()
         except Exception:
             pass
 
-        # Start operation in separate thread
+        # Start operation on the worker thread
         self.set_operation_running(True)
-        self.status_label.config(text=i18n.t("writing_nand"))
-
-        def write_thread():
-            try:
-                with open(self.selected_dump_path, "rb") as f:
-                    data = f.read()
-
-                success = self.controller.write_nand(data, progress_callback=self.update_progress)
-                if success:
-                    self.status_label.config(text=i18n.t("write_completed"))
-                    messagebox.showinfo(i18n.t("success_title"), i18n.t("write_completed"))
-                else:
-                    self.status_label.config(text=i18n.t("write_failed"))
-                    messagebox.showerror(i18n.t("error_title"), i18n.t("write_failed"))
-            except Exception as e:
-                self.logger.error(f"Error during write operation: {e}")
-                self.status_label.config(text=i18n.t("write_failed"))
-                messagebox.showerror(i18n.t("error_title"), i18n.t("write_failed"))
-            finally:
-                self.set_operation_running(False)
-                self.progress_var.set(0)
-                self.progress_label.config(text=i18n.t("ready"))
+        self.status_label.config(text=self._T.writing_nand)
 
-        threading.Thread(target=write_thread, daemon=True).start()
+        self._submit("write", self._run_write, dump_file)
 
     def erase_nand(self):
         """Start NAND erase operation"""
         if not self.is_connected:
-            messagebox.showerror(i18n.t("error_title"), i18n.t("not_connected_to_pico"))
+            messagebox.showerror(self._T.error_title, self._T.not_connected_to_pico)
             return
 
         if not self.controller.current_nand_info:
@@ -526,7 +745,7 @@ class NANDFlasherGUI:
             return
 
         # Confirm operation
-        if not messagebox.askyesno(i18n.t("confirm_erase_title"), i18n.t("confirm_erase_text")):
+        if not messagebox.askyesno(self._T.confirm_erase_title, self._T.confirm_erase_text):
             return
 
         # Resume prompt (if applicable)
@@ -534,39 +753,135 @@ class NANDFlasherGUI:
             resume = self.controller.get_resume_state()
             if resume.get("operation") == "ERASE":
                 if not messagebox.askyesno(
-                    i18n.t("resume_found_title"), i18n.t("resume_erase_text")
+                    self._T.resume_found_title, self._T.resume_erase_text
                 ):
                     self.controller.clear_resume_state()
         except Exception:
             pass
 
-        # Start operation in separate thread
+        # Start operation on the worker thread
         self.set_operation_running(True)
-        self.status_label.config(text=i18n.t("erasing_nand"))
-
-        def erase_thread():
+        self.status_label.config(text=self._T.erasing_nand)
+
+        self._submit("erase", self._run_erase)
+
+    def _submit(self, kind: str, fn, *args):
+        """Run an operation on the worker thread and report its outcome when done"""
+        self._current_fut = self._executor.submit(fn, *args)
+        self._current_fut.add_done_callback(lambda fut: self._on_done(kind, fut))
+
+    def _progress(self, value: int):
+        """Progress callback for operations; unwinds the operation once cancelled"""
+        if self.controller.abort_requested:
+            raise OperationAbortedException("Operation cancelled by user")
+        self.update_progress(value)
+
+    def _run_read(self, save_path: str) -> bool:
+        """Read the NAND into save_path (worker thread)"""
+        # Pages go straight to the file as they arrive instead of
+        # buffering the whole image in memory
+        ok = False
+        with open(save_path, "wb", buffering=DUMP_BUFFER_SIZE) as f:
             try:
-                success = self.controller.erase_nand(progress_callback=self.update_progress)
-                if success:
-                    self.status_label.config(text=i18n.t("erase_completed"))
-                    messagebox.showinfo(i18n.t("success_title"), i18n.t("erase_completed"))
-                else:
-                    self.status_label.config(text=i18n.t("erase_failed"))
-                    messagebox.showerror(i18n.t("error_title"), i18n.t("erase_failed"))
-            except Exception as e:
-                self.logger.error(f"Error during erase operation: {e}")
-                self.status_label.config(text=i18n.t("erase_failed"))
-                messagebox.showerror(i18n.t("error_title"), i18n.t("erase_failed"))
+                ok = self.controller.read_nand_stream(f.write, progress_callback=self._progress)
+                f.flush()
+                # The dump is rarely read back right away; keep it out of the page cache
+                if ok and hasattr(os, "posix_fadvise"):
+                    os.fdatasync(f.fileno())
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
             finally:
-                self.set_operation_running(False)
-                self.progress_var.set(0)
-                self.progress_label.config(text="Ready")
+                if not ok:
+                    # Do not leave a truncated dump behind (also when cancelled)
+                    f.close()
+                    os.remove(save_path)
+        return ok
+
+    def _run_write(self, dump_file) -> bool:
+        """Write the open dump file to the NAND (worker thread); closes dump_file"""
+        # Map the dump rather than reading it into memory; the controller
+        # slices chunks out of the memoryview as it sends them. The mapping is
+        # kept for retries while the file's (size, mtime, inode) is unchanged.
+        with dump_file:
+            st = os.fstat(dump_file.fileno())
+            fingerprint = (st.st_size, st.st_mtime_ns, st.st_ino)
+            with self._dump_lock:
+                mm = self._dump_mmap
+                if mm is None or fingerprint != self._dump_fp:
+                    self._close_dump_map()
+                    mm = mmap.mmap(dump_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._dump_mmap = mm
+                    self._dump_fp = fingerprint
+                self._dump_busy = True
+        data = memoryview(mm)
+        try:
+            return self.controller.write_nand(data, progress_callback=self._progress)
+        finally:
+            data.release()
+            with self._dump_lock:
+                self._dump_busy = False
+                if self._dump_release_pending:
+                    self._dump_release_pending = False
+                    self._close_dump_map()
+
+    def _release_dump_map(self):
+        """Drop the cached mapping of the selected dump (after the running write, if any)"""
+        with self._dump_lock:
+            if self._dump_busy:
+                self._dump_release_pending = True
+            else:
+                self._close_dump_map()
+
+    def _close_dump_map(self):
+        """Close the cached mapping now (caller holds _dump_lock)"""
+        mm, self._dump_mmap = self._dump_mmap, None
+        self._dump_fp = None
+        if mm is not None:
+            try:
+                mm.close()
+            except BufferError:
+                # Still being written from; unmapped once the last view is released
+                pass
+
+    def _run_erase(self) -> bool:
+        """Erase the NAND (worker thread)"""
+        return bool(self.controller.erase_nand(progress_callback=self._progress))
 
-        threading.Thread(target=erase_thread, daemon=True).start()
+    def _on_done(self, kind: str, fut):
+        """Post the outcome of a finished operation to the UI (worker thread)"""
+        try:
+            ok = fut.result()
+        except OperationAbortedException:
+            # Expected on cancel; the controller has already stopped the device
+            ok = False
+        except Exception as e:
+            self.logger.error(f"Error during {kind} operation: {e}")
+            ok = False
+
+        if self.controller.abort_requested:
+            self.logger.info(f"{kind.capitalize()} operation cancelled")
+            self._ui_q.put(("status", self._T.operation_cancelled))
+        elif ok:
+            done = getattr(self._T, f"{kind}_completed")
+            self._ui_q.put(("status", done))
+            self._ui_q.put(("info", (self._T.success_title, done)))
+        else:
+            failed = getattr(self._T, f"{kind}_failed")
+            self._ui_q.put(("status", failed))
+            self._ui_q.put(("error", (self._T.error_title, failed)))
+        self._ui_q.put(("running", False))
+        # Queued behind any pending progress update
+        self._ui_q.put(("reset_progress", None))
+
+    def cancel_operation(self):
+        """Ask the running operation to stop at its next progress update"""
+        if self.is_operation_running:
+            self.controller.request_abort()
+            self.cancel_btn.config(state="disabled")
 
     def run(self):
         """Start the GUI main loop"""
         self.logger.info("Starting GUI main loop")
+        self._pump()
         self.root.mainloop()
 
 
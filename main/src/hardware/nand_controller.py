@@ -4,167 +4,270 @@ Provides a clean interface between the application logic and hardware communicat
 """
 
 import json
+import os
+import queue
+import selectors
 import struct
+import threading
 import time
 import zlib
 from pathlib import Path
+from types import MappingProxyType
 
 import serial
 
+try:
+    import orjson
+except ImportError:  # optional: faster encoding, stdlib json otherwise
+    orjson = None
+
 from ..config.settings import config_manager
 from ..utils.ecc import verify_and_correct
 from ..utils.exceptions import (
     ConnectionException,
+    OperationAbortedException,
 )
 from ..utils.logging_config import get_logger
 
-
-class NANDController:
-    """Hardware abstraction layer for NAND Flash operations"""
-
-    def __init__(self):
-        self.logger = get_logger()
-        self.ser: serial.Serial | None = None
-        self.is_connected = False
-        self.current_nand_info = None
-        self.baudrate = config_manager.get("default_baudrate")
-        self.timeout = config_manager.get("connection_timeout")
-        self.use_binary = bool(config_manager.get("use_binary_protocol", False))
-        # Resume state persistence
-        self._resume_path = Path(config_manager.config_path).parent / "resume.json"
-        # Framed protocol constants
-        self.MAGIC = b"PF"  # Pico Flasher
-        # Command codes
-        self.CMD_STATUS = 0x01
-        self.CMD_READ = 0x02
-        self.CMD_WRITE = 0x03
-        self.CMD_ERASE = 0x04
-        self.CMD_PROGRESS = 0x10
-        self.CMD_READY_FOR_DATA = 0x11
-        self.CMD_COMPLETE = 0x12
-        self.CMD_ERROR = 0x13
-        self.CMD_MODEL = 0x14
-        self.CMD_POWER_WARNING = 0x15
-        self.CMD_PAGE_CRC = 0x16
-
-        # Supported NAND chips database
-        self.supported_nand = {
+# After opening the port, wait until the line has been quiet this long (s)...
+SETTLE_QUIET = 0.1
+# ...but never longer than this in total (s)
+SETTLE_MAX = 2.0
+# Text progress lines are PROGRESS:<percent>
+_PROGRESS_PREFIX = "PROGRESS:"
+_PROGRESS_LEN = len(_PROGRESS_PREFIX)
+# USB full-speed CDC bulk packet size; write chunks are kept a multiple of it
+USB_PACKET_SIZE = 64
+
+
+def _dump_state(state: dict) -> bytes:
+    """Serialize resume state to compact UTF-8 JSON (the file is machine-read only)."""
+    if orjson is not None:
+        return orjson.dumps(state)
+    return json.dumps(state, separators=(",", ":")).encode("utf-8")
+
+
+def _load_state(raw: bytes) -> dict:
+    """Parse resume state JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Precompiled little-endian parsers for frame headers and payload fields
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U32X2 = struct.Struct("<II")
+_FRAME_HEADER = struct.Struct("<BI")  # CMD u8, LEN u32
+# Write data is queued and handed to the port in batches of about this many bytes
+WRITE_BATCH_SIZE = 64 * 1024
+# Frames buffered between the read thread and the page consumer
+READ_QUEUE_FRAMES = 64
+# After CANCEL, wait at most this long for the device to end the operation (s); a
+# device blocked on write data only notices once its 15 s page read times out
+CANCEL_DRAIN_MAX = 20.0
+# Text replies that end a device operation
+_OPERATION_END = frozenset(
+    ("OPERATION_CANCELLED", "OPERATION_COMPLETE", "OPERATION_FAILED", "NAND_NOT_CONNECTED")
+)
+# Largest LEN accepted in a frame header; the device sends at most one page plus
+# spare (4096 + 128) per frame, so anything far beyond that is line noise
+MAX_FRAME_PAYLOAD = 64 * 1024
+# Encoded text-protocol command lines, built once
+_TEXT_COMMANDS = {
+    verb: f"{verb}\n".encode()
+    for verb in ("STATUS", "READ", "WRITE", "WRITE_NO_OOB", "ERASE", "CANCEL", "PAUSE", "RESUME")
+}
+
+# Supported NAND chips database, shared read-only by all controllers
+_SUPPORTED_NAND = MappingProxyType(
+    {
+        name: MappingProxyType(info)
+        for name, info in {
             # Samsung
             "Samsung K9F4G08U0A": {
-                "id": [0xEC, 0xD3],
+                "id": (0xEC, 0xD3),
                 "page_size": 2048,
                 "block_size": 128,
                 "blocks": 4096,
             },
             "Samsung K9F1G08U0A": {
-                "id": [0xEC, 0xF1],
+                "id": (0xEC, 0xF1),
                 "page_size": 2048,
                 "block_size": 128,
                 "blocks": 2048,
             },
             "Samsung K9F1G08R0A": {
-                "id": [0xEC, 0xF1],
+                "id": (0xEC, 0xF1),
                 "page_size": 2048,
                 "block_size": 64,
                 "blocks": 2048,
             },
             "Samsung K9GAG08U0M": {
-                "id": [0xEC, 0xD5],
+                "id": (0xEC, 0xD5),
                 "page_size": 4096,
                 "block_size": 256,
                 "blocks": 8192,
             },
             "Samsung K9T1G08U0M": {
-                "id": [0xEC, 0xF1],
+                "id": (0xEC, 0xF1),
                 "page_size": 2048,
                 "block_size": 128,
                 "blocks": 1024,
             },
             "Samsung K9F2G08U0M": {
-                "id": [0xEC, 0xDA],
+                "id": (0xEC, 0xDA),
                 "page_size": 2048,
                 "block_size": 128,
                 "blocks": 2048,
             },
             # Hynix
             "Hynix HY27US08281A": {
-                "id": [0xAD, 0xF1],
+                "id": (0xAD, 0xF1),
                 "page_size": 2048,
                 "block_size": 128,
                 "blocks": 1024,
             },
             "Hynix H27UBG8T2A": {
-                "id": [0xAD, 0xD3],
+                "id": (0xAD, 0xD3),
                 "page_size": 4096,
                 "block_size": 256,
                 "blocks": 8192,
             },
             "Hynix HY27UF082G2B": {
-                "id": [0xAD, 0xF1],
+                "id": (0xAD, 0xF1),
                 "page_size": 2048,
                 "block_size": 128,
                 "blocks": 2048,
             },
             "Hynix H27U4G8F2D": {
-                "id": [0xAD, 0xD5],
+                "id": (0xAD, 0xD5),
                 "page_size": 4096,
                 "block_size": 256,
                 "blocks": 4096,
             },
             "Hynix H27U4G8F2DTR": {
-                "id": [0xAD, 0xD5],
+                "id": (0xAD, 0xD5),
                 "page_size": 4096,
                 "block_size": 256,
                 "blocks": 4096,
             },
             # Toshiba
             "Toshiba TC58NVG2S3E": {
-                "id": [0x98, 0xDA],
+                "id": (0x98, 0xDA),
                 "page_size": 2048,
                 "block_size": 128,
                 "blocks": 2048,
             },
             "Toshiba TC58NVG3S0F": {
-                "id": [0x98, 0xF1],
+                "id": (0x98, 0xF1),
                 "page_size": 4096,
                 "block_size": 256,
                 "blocks": 4096,
             },
             # Micron
             "Micron MT29F4G08ABA": {
-                "id": [0x2C, 0xDC],
+                "id": (0x2C, 0xDC),
                 "page_size": 4096,
                 "block_size": 256,
                 "blocks": 4096,
             },
             "Micron MT29F8G08ABACA": {
-                "id": [0x2C, 0x68],
+                "id": (0x2C, 0x68),
                 "page_size": 4096,
                 "block_size": 256,
                 "blocks": 8192,
             },
             # Intel
             "Intel JS29F32G08AAMC1": {
-                "id": [0x89, 0xD3],
+                "id": (0x89, 0xD3),
                 "page_size": 4096,
                 "block_size": 256,
                 "blocks": 8192,
             },
             "Intel JS29F64G08ACMF3": {
-                "id": [0x89, 0xD7],
+                "id": (0x89, 0xD7),
                 "page_size": 4096,
                 "block_size": 256,
                 "blocks": 16384,
             },
             # SanDisk
             "SanDisk SDTNQGAMA-008G": {
-                "id": [0x45, 0xD7],
+                "id": (0x45, 0xD7),
                 "page_size": 4096,
                 "block_size": 256,
                 "blocks": 8192,
             },
+        }.items()
+    }
+)
+# (maker, device) ID -> every model reporting it, in table order. Several
+# models share an ID (e.g. the K9F1G08 variants); the first is the default.
+_NAND_ID_INDEX: dict[tuple[int, int], tuple[str, ...]] = {}
+for _name, _info in _SUPPORTED_NAND.items():
+    _NAND_ID_INDEX[_info["id"]] = _NAND_ID_INDEX.get(_info["id"], ()) + (_name,)
+del _name, _info
+
+
+class NANDController:
+    """Hardware abstraction layer for NAND Flash operations"""
+
+    def __init__(self):
+        self.logger = get_logger()
+        self.ser: serial.Serial | None = None
+        self.is_connected = False
+        # Chip geometry; setting current_nand_info also caches the data size
+        self._nand_info = None
+        self.nand_total_size = 0
+        self._page_size = 0
+        self._spare_size = 0
+        self._page_total = 0
+        # Set by request_abort(); reset when the next operation starts
+        self.abort_requested = False
+        self.baudrate = config_manager.get("default_baudrate")
+        self.timeout = config_manager.get("connection_timeout")
+        self.use_binary = bool(config_manager.get("use_binary_protocol", False))
+        # Bytes received from the port but not yet consumed by the frame parser
+        self._rx = bytearray()
+        # Read timeout currently applied to the port (changing it reconfigures the port)
+        self._port_timeout: float | None = None
+        # Readiness selector on the port's fd (POSIX only), for waiting without polling
+        self._sel: selectors.BaseSelector | None = None
+        # Resume state persistence
+        self._resume_path = Path(config_manager.config_path).parent / "resume.json"
+        # Checkpoints are written by a short-lived background thread; only the
+        # latest state still waiting to be written is kept
+        self._resume_lock = threading.Lock()
+        self._resume_pending: dict | None = None
+        self._resume_thread: threading.Thread | None = None
+        # Serialized form of the last state written, to skip identical rewrites
+        self._resume_blob: bytes | None = None
+        # Framed protocol constants
+        self.MAGIC = b"PF"  # Pico Flasher
+        # Command codes
+        self.CMD_STATUS = 0x01
+        self.CMD_READ = 0x02
+        self.CMD_WRITE = 0x03
+        self.CMD_ERASE = 0x04
+        self.CMD_PROGRESS = 0x10
+        self.CMD_READY_FOR_DATA = 0x11
+        self.CMD_COMPLETE = 0x12
+        self.CMD_ERROR = 0x13
+        self.CMD_MODEL = 0x14
+        self.CMD_POWER_WARNING = 0x15
+        self.CMD_PAGE_CRC = 0x16
+        # Framed command packets (no payload), built once
+        self._framed_commands = {
+            "STATUS": self._frame(self.CMD_STATUS),
+            "READ": self._frame(self.CMD_READ),
+            "WRITE": self._frame(self.CMD_WRITE),
+            "ERASE": self._frame(self.CMD_ERASE),
         }
 
+        # Supported NAND chips database
+        self.supported_nand = _SUPPORTED_NAND
+        self._by_id = _NAND_ID_INDEX
+
     def connect(self, port: str) -> bool:
         """
         Connect to the Pico device
@@ -178,12 +281,18 @@ class NANDController:
         try:
             self.logger.info(f"Attempting to connect to {port} at {self.baudrate} baud")
             self.ser = serial.Serial(port, self.baudrate, timeout=self.timeout)
+            self._port_timeout = self.timeout
+            fd = getattr(self.ser, "fd", None)
+            if fd is not None:
+                self._sel = selectors.DefaultSelector()
+                self._sel.register(fd, selectors.EVENT_READ)
             self.ser.flush()
 
-            # Small delay for stabilization
-            time.sleep(2)
+            # Let start-up output drain instead of always sleeping the full window
+            self._wait_quiet()
             # Clear input buffer in case of garbage data
             self.ser.reset_input_buffer()
+            self._rx.clear()
 
             self.is_connected = True
             self.logger.info(f"Successfully connected to {port}")
@@ -193,6 +302,17 @@ class NANDController:
             self.is_connected = False
             raise ConnectionException(f"Failed to connect to {port}: {e}") from e
 
+    def _wait_quiet(self) -> None:
+        """Discard incoming bytes until the line is idle for SETTLE_QUIET (or SETTLE_MAX passes)"""
+        deadline = time.monotonic() + SETTLE_MAX
+        self._apply_timeout(SETTLE_QUIET)
+        try:
+            while time.monotonic() < deadline:
+                if not self.ser.read(max(1, self.ser.in_waiting)):
+                    break
+        finally:
+            self._apply_timeout(None)
+
     def disconnect(self) -> None:
         """Disconnect from the Pico device"""
         if self.ser and self.ser.is_open:
@@ -204,7 +324,12 @@ class NANDController:
                     self.ser.write(b"EXIT\n")
             except (OSError, AttributeError):
                 pass
+            if self._sel is not None:
+                self._sel.close()
+                self._sel = None
             self.ser.close()
+            self._rx.clear()
+            self._flush_resume_state()
             self.is_connected = False
             self.logger.info("Disconnected from device")
 
@@ -213,11 +338,14 @@ class NANDController:
     # =====================
     def _frame(self, cmd: int, payload: bytes = b"") -> bytes:
         """Build a framed packet: MAGIC(2) + CMD(1) + LEN(4 LE) + PAYLOAD + CRC32(4 LE). CRC over CMD+LEN+PAYLOAD."""
-        header = struct.pack("<c", bytes([cmd])) + struct.pack("<I", len(payload))
-        crc_input = header + payload
-        crc = zlib.crc32(crc_input) & 0xFFFFFFFF
-        frame = self.MAGIC + header + payload + struct.pack("<I", crc)
-        return frame
+        return b"".join(self._frame_parts(cmd, payload))
+
+    def _frame_parts(self, cmd: int, payload: bytes = b"") -> tuple:
+        """Pieces of a framed packet, to be joined (alone or with other frames) in one copy"""
+        header = _FRAME_HEADER.pack(cmd, len(payload))
+        # Chain the CRC over header then payload instead of concatenating them
+        crc = zlib.crc32(payload, zlib.crc32(header)) & 0xFFFFFFFF
+        return self.MAGIC, header, payload, _U32.pack(crc)
 
     def _send_frame(self, cmd: int, payload: bytes = b"") -> None:
         if not self.ser:
@@ -225,89 +353,216 @@ class NANDController:
         data = self._frame(cmd, payload)
         self.ser.write(data)
 
-    def _read_exact(self, n: int, timeout: float | None = None) -> bytes | None:
-        """Read exactly n bytes or return None on timeout."""
-        if not self.ser:
-            return None
-        start = time.time()
-        buf = bytearray()
-        to = timeout or self.timeout
-        while len(buf) < n and (time.time() - start) < to:
-            if self.ser.in_waiting:
-                chunk = self.ser.read(n - len(buf))
-                if chunk:
-                    buf.extend(chunk)
-            else:
-                time.sleep(0.005)
-        return bytes(buf) if len(buf) == n else None
+    def _apply_timeout(self, timeout: float | None) -> float:
+        """Set the port's read timeout if it differs from the one in effect"""
+        timeout = timeout or self.timeout
+        if timeout != self._port_timeout:
+            self.ser.timeout = timeout
+            self._port_timeout = timeout
+        return timeout
 
-    def _read_frame(self, timeout: float | None = None) -> tuple[int, bytes] | None:
+    def _fill_rx(self, n: int, deadline: float, stop: threading.Event | None = None) -> bool:
+        """
+        Grow the receive buffer to at least n bytes
+
+        Each pass pulls everything the driver has queued in one read instead of
+        polling for a byte at a time. Returns False if the deadline passes (or
+        stop is set) first. With stop, reads never block, so it is noticed promptly.
+        """
+        rx = self._rx
+        ser = self.ser
+        while len(rx) < n:
+            if time.monotonic() >= deadline or (stop is not None and stop.is_set()):
+                return False
+            if stop is not None:
+                if not ser.in_waiting:
+                    if self._sel is not None:
+                        self._sel.select(0.02)
+                    else:
+                        stop.wait(0.005)
+                    continue
+                chunk = ser.read(ser.in_waiting)
+            else:
+                chunk = ser.read(max(n - len(rx), ser.in_waiting))
+            if chunk:
+                rx += chunk
+        return True
+
+    def _read_frame(
+        self, timeout: float | None = None, stop: threading.Event | None = None
+    ) -> tuple[int, bytes] | None:
         """Read one framed packet and verify CRC. Returns (cmd, payload) or None on timeout/error."""
-        to = timeout or self.timeout
-        start = time.time()
-        # Seek MAGIC
-        sync = b""
-        while time.time() - start < to:
-            b1 = self._read_exact(1, to)
-            if not b1:
-                return None
-            sync = (sync + b1)[-2:]
-            if sync == self.MAGIC:
-                break
-        else:
-            return None
-        # Read CMD(1) + LEN(4)
-        header = self._read_exact(5, to)
-        if not header:
-            return None
-        cmd = header[0]
-        length = struct.unpack("<I", header[1:5])[0]
-        # Read payload and CRC
-        payload = self._read_exact(length, to) if length > 0 else b""
-        if payload is None:
-            return None
-        crc_bytes = self._read_exact(4, to)
-        if not crc_bytes:
-            return None
-        recv_crc = struct.unpack("<I", crc_bytes)[0]
-        calc_crc = zlib.crc32(header + payload) & 0xFFFFFFFF
-        if recv_crc != calc_crc:
-            self.logger.warning("CRC mismatch in framed packet")
+        if not self.ser:
             return None
-        return cmd, payload
+        deadline = time.monotonic() + self._apply_timeout(timeout)
+        rx = self._rx
+        while True:
+            if stop is not None and stop.is_set():
+                return None
+            # Seek MAGIC, dropping any noise in front of it
+            while True:
+                start = rx.find(self.MAGIC)
+                if start >= 0:
+                    del rx[:start]
+                    break
+                # Keep a trailing half of MAGIC that may complete with the next read
+                del rx[: max(len(rx) - 1, 0)]
+                if not self._fill_rx(len(rx) + 1, deadline, stop):
+                    return None
+            # MAGIC(2) + CMD(1) + LEN(4), then payload and CRC. A MAGIC found in noise
+            # has a bogus header, so on an oversized LEN, a timeout or a CRC mismatch
+            # only its first byte is dropped and the buffer is scanned again
+            if not self._fill_rx(7, deadline, stop):
+                del rx[:1]
+                continue
+            cmd = rx[2]
+            length = _U32.unpack_from(rx, 3)[0]
+            if length > MAX_FRAME_PAYLOAD:
+                del rx[:1]
+                continue
+            end = 7 + length + 4
+            if not self._fill_rx(end, deadline, stop):
+                del rx[:1]
+                continue
+            payload = bytes(rx[7 : 7 + length])
+            recv_crc = _U32.unpack_from(rx, 7 + length)[0]
+            # Chain the CRC over header then payload rather than concatenating them
+            calc_crc = zlib.crc32(payload, zlib.crc32(rx[2:7])) & 0xFFFFFFFF
+            if recv_crc != calc_crc:
+                self.logger.warning("CRC mismatch in framed packet")
+                del rx[:1]
+                continue
+            del rx[:end]
+            return cmd, payload
 
     # =====================
     # Resume state helpers
     # =====================
     def _load_resume_state(self) -> dict:
+        self._flush_resume_state()
         try:
             if self._resume_path.exists():
-                with open(self._resume_path, encoding="utf-8") as f:
-                    return json.load(f)
+                return _load_state(self._resume_path.read_bytes())
         except Exception as e:
             self.logger.warning(f"Failed to load resume state: {e}")
         return {}
 
     def _save_resume_state(self, state: dict) -> None:
+        """Queue state to be written in the background, replacing any unwritten one"""
+        with self._resume_lock:
+            self._resume_pending = dict(state)
+            if self._resume_thread is None:
+                self._resume_thread = threading.Thread(
+                    target=self._resume_writer, name="resume-save", daemon=True
+                )
+                self._resume_thread.start()
+
+    def _resume_writer(self) -> None:
+        """Write queued resume states until none is left (background thread)"""
+        while True:
+            with self._resume_lock:
+                state, self._resume_pending = self._resume_pending, None
+                if state is None:
+                    self._resume_thread = None
+                    return
+            self._write_resume_state(state)
+
+    def _write_resume_state(self, state: dict) -> None:
         try:
+            blob = _dump_state(state)
+            if blob == self._resume_blob:
+                return
             self._resume_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._resume_path, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2)
+            # Replace the file in one step so a reader never sees a partial state
+            tmp_path = self._resume_path.with_suffix(".tmp")
+            tmp_path.write_bytes(blob)
+            os.replace(tmp_path, self._resume_path)
+            self._resume_blob = blob
         except Exception as e:
             self.logger.warning(f"Failed to save resume state: {e}")
 
+    def _flush_resume_state(self) -> None:
+        """Wait until every queued resume state has been written"""
+        with self._resume_lock:
+            writer = self._resume_thread
+        if writer is not None:
+            writer.join()
+
     def get_resume_state(self) -> dict:
         """Expose current resume state (or empty dict)."""
         return self._load_resume_state()
 
     def clear_resume_state(self) -> None:
         """Clear resume state file."""
+        # Drop any unwritten state and let an in-flight write finish first, so the
+        # file is not recreated after it has been removed
+        with self._resume_lock:
+            self._resume_pending = None
+        self._flush_resume_state()
+        self._resume_blob = None
         try:
             if self._resume_path.exists():
                 self._resume_path.unlink()
         except Exception as e:
             self.logger.warning(f"Failed to clear resume state: {e}")
 
+    @property
+    def current_nand_info(self):
+        """Geometry of the selected NAND chip, or None"""
+        return self._nand_info
+
+    @current_nand_info.setter
+    def current_nand_info(self, info) -> None:
+        self._nand_info = info
+        # Layout constants are fixed for the selected chip, so compute them once here
+        # rather than per transfer; nand_total_size excludes the spare area
+        self._page_size = info["page_size"] if info else 0
+        self._spare_size = (128 if self._page_size == 4096 else 64) if info else 0
+        self._page_total = self._page_size + self._spare_size
+        self.nand_total_size = info["blocks"] * info["block_size"] * self._page_size if info else 0
+
+    def request_abort(self) -> None:
+        """
+        Ask the running read/write/erase to stop
+
+        The flag is checked by the caller's progress callback, which raises
+        OperationAbortedException to unwind the operation; on the way out the
+        controller sends CANCEL to the device and drains its remaining output.
+        The flag is cleared when the next operation starts.
+        """
+        self.logger.info("Abort requested")
+        self.abort_requested = True
+
+    def _cancel_device(self) -> None:
+        """
+        Stop the device side of an aborted operation
+
+        Sends CANCEL, then discards what the device still sends until it reports
+        the operation over (or CANCEL_DRAIN_MAX passes), so leftover pages and
+        progress are not taken as replies to the next command.
+        """
+        self.logger.info("Sending CANCEL to device")
+        try:
+            self.ser.write(_TEXT_COMMANDS["CANCEL"])
+        except Exception as e:
+            self.logger.warning(f"Failed to send CANCEL: {e}")
+            return
+        deadline = time.monotonic() + CANCEL_DRAIN_MAX
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                if self.use_binary:
+                    frame = self._read_frame(remaining)
+                    if frame is None or frame[0] in (self.CMD_COMPLETE, self.CMD_ERROR):
+                        break
+                else:
+                    response = self.read_response(remaining)
+                    if response is None or response in _OPERATION_END:
+                        break
+            self.ser.reset_input_buffer()
+        except Exception as e:
+            self.logger.warning(f"Error while draining after CANCEL: {e}")
+        self._rx.clear()
+
     def send_command(self, command: str) -> None:
         """
         Send a command to the Pico device
@@ -321,23 +576,15 @@ class NANDController:
 
         try:
             if self.use_binary:
-                cmd_map = {
-                    "STATUS": self.CMD_STATUS,
-                    "READ": self.CMD_READ,
-                    "WRITE": self.CMD_WRITE,
-                    "ERASE": self.CMD_ERASE,
-                }
-                code = cmd_map.get(command)
-                if code is None:
+                packet = self._framed_commands.get(command)
+                if packet is None:
                     # Fall back to legacy text if unknown
-                    command_bytes = f"{command}\n".encode()
-                    self.ser.write(command_bytes)
+                    self.ser.write(_TEXT_COMMANDS.get(command) or f"{command}\n".encode())
                 else:
-                    self._send_frame(code)
+                    self.ser.write(packet)
                     self.logger.debug(f"Sent framed command: {command}")
             else:
-                command_bytes = f"{command}\n".encode()
-                self.ser.write(command_bytes)
+                self.ser.write(_TEXT_COMMANDS.get(command) or f"{command}\n".encode())
                 self.logger.debug(f"Sent command: {command}")
         except Exception as e:
             self.logger.error(f"Error sending command: {e}")
@@ -366,7 +613,7 @@ class NANDController:
                 # Map framed responses to string tags for current code until full refactor
                 if cmd == self.CMD_PROGRESS:
                     try:
-                        progress = int.from_bytes(payload[:2], "little")
+                        progress = _U16.unpack_from(payload)[0]
                     except Exception:
                         progress = 0
                     return f"PROGRESS:{progress}"
@@ -392,16 +639,15 @@ class NANDController:
                 self.logger.debug(f"Unknown framed response cmd=0x{cmd:02X}, {len(payload)} bytes")
                 return None
             else:
-                start_time = time.time()
-                timeout = timeout or self.timeout
-                while time.time() - start_time < timeout:
-                    if self.ser.in_waiting > 0:
-                        response = self.ser.readline().decode("utf-8", errors="ignore").strip()
-                        self.logger.debug(f"Received response: {response}")
-                        return response
-                    time.sleep(0.01)
-                self.logger.warning("Timeout waiting for response")
-                return None
+                # readline() blocks in the driver until a line or the port timeout
+                self._apply_timeout(timeout)
+                line = self.ser.readline()
+                if not line:
+                    self.logger.warning("Timeout waiting for response")
+                    return None
+                response = line.decode("utf-8", errors="ignore").strip()
+                self.logger.debug(f"Received response: {response}")
+                return response
         except Exception as e:
             self.logger.error(f"Error reading response: {e}")
             return None
@@ -428,70 +674,176 @@ class NANDController:
             self.current_nand_info = nand_info
             self.logger.info(f"NAND detected: {model_name}")
             return True, model_name, nand_info
+        if response and response.startswith("ID:"):
+            # Raw ID bytes as hex, e.g. ID:ECD3
+            try:
+                chip_id = tuple(bytes.fromhex(response[3:])[:2])
+            except ValueError:
+                chip_id = ()
+            candidates = self._by_id.get(chip_id)
+            if candidates:
+                model_name = candidates[0]
+                nand_info = self.supported_nand[model_name]
+                self.current_nand_info = nand_info
+                self.logger.info(f"NAND detected by ID {response[3:]}: {model_name}")
+                if len(candidates) > 1:
+                    self.logger.warning(
+                        f"ID {response[3:]} also matches {', '.join(candidates[1:])}; "
+                        "select the model manually if geometry differs"
+                    )
+                return True, model_name, nand_info
 
         self.logger.info("NAND not detected, manual selection may be required")
         return False, None, None
 
-    def read_nand(self, progress_callback=None) -> bytes | None:
+    def read_nand(self, progress_callback=None, out=None) -> bytearray | memoryview | None:
         """
-        Read data from NAND
+        Read data from NAND into memory
 
         Args:
             progress_callback: Optional callback function for progress updates
+            out: Optional preallocated writable buffer (bytearray, mmap, ...) that
+                pages are copied into in place instead of growing a new buffer
 
         Returns:
-            NAND data as bytes or None if failed
+            NAND data as a bytearray (a memoryview over the filled part of out
+            when given) or None if failed
+        """
+        if out is None:
+            # Size the buffer from the chip geometry up front; pages are copied into
+            # place and the buffer only grows if the spare area is included
+            nand_data = bytearray(self.nand_total_size)
+            filled = 0
+
+            def store(page: bytes) -> None:
+                nonlocal filled
+                end = filled + len(page)
+                nand_data[filled:end] = page
+                filled = end
+
+            if not self.read_nand_stream(store, progress_callback=progress_callback):
+                return None
+            del nand_data[filled:]
+            return nand_data
+
+        view = memoryview(out).cast("B")
+        offset = 0
+
+        def fill(page: bytes) -> None:
+            nonlocal offset
+            end = offset + len(page)
+            if end > len(view):
+                raise ValueError(f"Output buffer too small ({len(view)} bytes)")
+            view[offset:end] = page
+            offset = end
+
+        if not self.read_nand_stream(fill, progress_callback=progress_callback):
+            return None
+        return view[:offset]
+
+    def read_nand_stream(self, write_chunk, progress_callback=None) -> bool:
+        """
+        Read data from NAND, handing each page to write_chunk as it arrives
+
+        Args:
+            write_chunk: Callable receiving dump data page by page as bytes or
+                memoryview (e.g. a file's write)
+            progress_callback: Optional callback function for progress updates
+
+        Returns:
+            True if successful, False otherwise
         """
         self.logger.info("Starting NAND read operation...")
+        self.abort_requested = False
 
         if not self.is_connected or not self.current_nand_info:
             self.logger.error("No connected NAND chip")
-            return None
+            return False
 
         self.send_command("READ")
 
-        # Collect data and progress updates
-        nand_data = bytearray()
-        total_size = (
-            self.current_nand_info["blocks"]
-            * self.current_nand_info["block_size"]
-            * self.current_nand_info["page_size"]
-        )
+        page_size = self._page_size
+        page_total = self._page_total
+        total_size = self.nand_total_size
+        include_oob = bool(config_manager.get("include_oob", False))
+        # ECC settings, read once for the whole dump
+        ecc_enabled = bool(config_manager.get("enable_ecc", False))
+        if ecc_enabled:
+            ecc_scheme = str(config_manager.get("ecc_scheme", "crc16"))
+            ecc_sector_size = int(config_manager.get("ecc_sector_size", 512))
+            ecc_bytes_per_sector = int(config_manager.get("ecc_bytes_per_sector", 2))
+            ecc_oob_offset = int(config_manager.get("ecc_oob_offset", 0))
 
         self.logger.info(f"Reading {total_size} bytes from NAND")
 
+        def emit(payload: bytes) -> None:
+            # The device sends one page (+spare) per DATA frame; drop the spare unless requested
+            if not include_oob and len(payload) > page_size:
+                # A view, so the page bytes are not copied before the sink copies them
+                payload = memoryview(payload)[:page_size]
+            write_chunk(payload)
+
+        reader = None
+        stop_reader = threading.Event()
         try:
             if self.use_binary:
                 # In framed mode, expect a stream of DATA frames interleaved with PROGRESS and end with COMPLETE
                 page_counter = 0
                 resume = self._load_resume_state()
-                # Determine if we should discard previously read bytes (resume)
+                # Determine if we should discard previously read pages (resume)
                 discard_pages = 0
                 resume_last_page = 0
                 resume_page_crc = None
-                if resume.get("operation") == "READ" and self.current_nand_info:
+                if resume.get("operation") == "READ":
                     resume_last_page = int(resume.get("last_page", 0))
                     discard_pages = resume_last_page
                     resume_page_crc = resume.get("page_crc32")
-                page_size = self.current_nand_info["page_size"]
-                spare_size = 128 if page_size == 4096 else 64
-                page_total = page_size + spare_size
-                bytes_to_discard = discard_pages * page_total
+                # Pages in the resumed range are held back until the checkpoint CRC is
+                # validated, so a mismatch can still emit them instead of losing them
+                held: list[bytes] = []
                 # Track pages read for resume validation
                 pages_read = 0
+
+                def restart_from_beginning() -> None:
+                    nonlocal discard_pages, resume_last_page, resume_page_crc
+                    self.logger.warning("Resume CRC mismatch for READ; restarting from beginning")
+                    self.clear_resume_state()
+                    discard_pages = 0
+                    resume_last_page = 0
+                    resume_page_crc = None
+                    for page in held:
+                        emit(page)
+                    held.clear()
+
+                def checkpoint_validated() -> None:
+                    nonlocal resume_page_crc
+                    resume_page_crc = None
+                    held.clear()
+
+                # Frames are pulled off the port on a reader thread, so USB transfers
+                # continue while pages are checked, stored and checkpointed here
+                frames: queue.Queue = queue.Queue(maxsize=READ_QUEUE_FRAMES)
+                reader = threading.Thread(
+                    target=self._pump_frames,
+                    args=(frames, stop_reader),
+                    name="nand-rx",
+                    daemon=True,
+                )
+                reader.start()
+
                 while True:
-                    frame = self._read_frame()
+                    frame = frames.get()
                     if not frame:
                         self.logger.error("No framed response from device")
-                        return None
+                        return False
                     cmd, payload = frame
                     if cmd == self.CMD_PROGRESS:
                         # Payload layout v2.5+: [percent u16][optional u32 page_idx]
-                        progress = int.from_bytes(payload[:2], "little") if len(payload) >= 2 else 0
+                        progress = _U16.unpack_from(payload)[0] if len(payload) >= 2 else 0
                         if progress_callback:
                             progress_callback(progress)
                         if len(payload) >= 6:
-                            page_idx = int.from_bytes(payload[2:6], "little")
+                            page_idx = _U32.unpack_from(payload, 2)[0]
                             resume.update(
                                 {
                                     "operation": "READ",
@@ -502,6 +854,10 @@ class NANDController:
                             self._save_resume_state(resume)
                     elif cmd == self.CMD_COMPLETE:
                         self.logger.info("NAND read completed successfully")
+                        # Checkpoint was never reached; keep the held pages rather than drop them
+                        for page in held:
+                            emit(page)
+                        held.clear()
                         # Save final checkpoint
                         resume.update(
                             {
@@ -515,12 +871,17 @@ class NANDController:
                         break
                     elif cmd == self.CMD_ERROR:
                         self.logger.error("NAND read operation failed")
-                        return None
+                        return False
                     elif cmd == self.CMD_PAGE_CRC:
                         # Payload layout: [page_idx u32][crc u32]
                         if len(payload) >= 8:
-                            page_idx = int.from_bytes(payload[0:4], "little")
-                            crc = int.from_bytes(payload[4:8], "little")
+                            page_idx, crc = _U32X2.unpack_from(payload)
+                            # Validate resume checkpoint when encountering stored last_page
+                            if resume_page_crc is not None and page_idx == resume_last_page:
+                                if int(resume_page_crc) != crc:
+                                    restart_from_beginning()
+                                else:
+                                    checkpoint_validated()
                             resume.update(
                                 {
                                     "operation": "READ",
@@ -530,99 +891,55 @@ class NANDController:
                                 }
                             )
                             self._save_resume_state(resume)
-                            # Validate resume checkpoint when encountering stored last_page
-                            if resume_page_crc is not None and page_idx == resume_last_page:
-                                if int(resume_page_crc) != crc:
-                                    self.logger.warning(
-                                        "Resume CRC mismatch for READ; restarting from beginning"
-                                    )
-                                    # Reset resume and discard logic
-                                    self.clear_resume_state()
-                                    discard_pages = 0
-                                    resume_last_page = 0
-                                    resume_page_crc = None
-                                    bytes_to_discard = 0
-                                    nand_data = (
-                                        bytearray()
-                                    )  # Clear any data read before CRC validation
+                    elif cmd != self.CMD_READ:
+                        # Only CMD_READ carries page data; anything else would shift the
+                        # page count used for resume and the resume discard
+                        if cmd == self.CMD_POWER_WARNING:
+                            self.logger.warning(
+                                f"Device power warning: {payload.decode(errors='replace')}"
+                            )
+                        else:
+                            self.logger.warning(
+                                f"Ignoring unexpected frame 0x{cmd:02X} ({len(payload)} bytes)"
+                            )
                     else:
-                        # Treat any other cmd as raw data payload for now
                         # Optional ECC verification (no correction)
-                        try:
-                            if (
-                                bool(config_manager.get("enable_ecc", False))
-                                and self.current_nand_info
-                            ):
-                                page_size = self.current_nand_info["page_size"]
-                                spare_size = 128 if page_size == 4096 else 64
-                                page_total = page_size + spare_size
-                                if len(payload) >= page_size:
-                                    data_part = payload[:page_size]
-                                    oob_part = (
-                                        payload[page_size:page_total]
-                                        if len(payload) >= page_total
-                                        else b""
-                                    )
-                                    scheme = str(config_manager.get("ecc_scheme", "crc16"))
-                                    sector_size = int(config_manager.get("ecc_sector_size", 512))
-                                    bytes_per_sector = int(
-                                        config_manager.get("ecc_bytes_per_sector", 2)
-                                    )
-                                    oob_offset = int(config_manager.get("ecc_oob_offset", 0))
-                                    _, corrected = verify_and_correct(
-                                        data_part,
-                                        oob_part,
-                                        scheme=scheme,
-                                        sector_size=sector_size,
-                                        bytes_per_sector=bytes_per_sector,
-                                        oob_offset=oob_offset,
-                                    )
-                                    if corrected:
-                                        self.logger.warning(
-                                            f"ECC: errors detected sectors={corrected[:5]} ..."
-                                        )
-                        except Exception:
-                            # ECC is best-effort; ignore errors
-                            pass
-
-                        # For resume validation, check if this is the page that should match the resume CRC
-                        # Only increment pages_read for actual data payloads (not for control frames)
-                        if cmd == self.CMD_READ:
-                            # Check if this is the page that should match resume CRC
-                            if resume_page_crc is not None and pages_read == resume_last_page:
-                                # Calculate CRC of this payload to compare with stored CRC
-                                calc_crc = zlib.crc32(payload) & 0xFFFFFFFF
-                                if calc_crc != int(resume_page_crc):
+                        if ecc_enabled and len(payload) >= page_size:
+                            try:
+                                # Views into the frame payload, so checking copies nothing
+                                view = memoryview(payload)
+                                _, corrected = verify_and_correct(
+                                    view[:page_size],
+                                    view[page_size:page_total],
+                                    scheme=ecc_scheme,
+                                    sector_size=ecc_sector_size,
+                                    bytes_per_sector=ecc_bytes_per_sector,
+                                    oob_offset=ecc_oob_offset,
+                                )
+                                if corrected:
                                     self.logger.warning(
-                                        "Resume CRC mismatch for READ; restarting from beginning"
+                                        f"ECC: errors detected sectors={corrected[:5]} ..."
                                     )
-                                    # Reset resume and discard logic
-                                    self.clear_resume_state()
-                                    discard_pages = 0
-                                    resume_last_page = 0
-                                    resume_page_crc = None
-                                    bytes_to_discard = 0
-                                    nand_data = (
-                                        bytearray()
-                                    )  # Clear any data read before CRC validation
-                                    # Continue to append this payload since we're now treating it as the first page
-
-                        if bytes_to_discard > 0:
-                            # Discard resumed portion
-                            if len(payload) <= bytes_to_discard:
-                                bytes_to_discard -= len(payload)
-                                # do not append
+                            except Exception:
+                                # ECC is best-effort; ignore errors
+                                pass
+
+                        # Check if this is the page that should match the resume CRC
+                        if resume_page_crc is not None and pages_read == resume_last_page:
+                            calc_crc = zlib.crc32(payload) & 0xFFFFFFFF
+                            if calc_crc != int(resume_page_crc):
+                                restart_from_beginning()
                             else:
-                                # append the remaining after discard
-                                start = bytes_to_discard
-                                nand_data.extend(payload[start:])
-                                bytes_to_discard = 0
+                                checkpoint_validated()
+
+                        if pages_read < discard_pages:
+                            # Resumed portion: hold until validated, or drop if there is no CRC
+                            if resume_page_crc is not None:
+                                held.append(payload)
                         else:
-                            nand_data.extend(payload)
+                            emit(payload)
 
-                        # Only increment pages_read counter for actual data payloads
-                        if cmd == self.CMD_READ:
-                            pages_read += 1
+                        pages_read += 1
 
                         # Save checkpoint periodically (every 64 pages)
                         page_counter += 1
@@ -642,64 +959,58 @@ class NANDController:
                     response = self.read_response()
                     if not response:
                         self.logger.error("No response from device")
-                        return None
-                    if response.startswith("PROGRESS:"):
+                        return False
+                    if response.startswith(_PROGRESS_PREFIX):
                         try:
-                            progress = int(response.split(":")[1])
+                            progress = int(response[_PROGRESS_LEN:])
                             self.logger.debug(f"Read progress: {progress}%")
                             if progress_callback:
                                 progress_callback(progress)
                         except ValueError:
                             pass
+                    elif response.startswith("DATA:"):
+                        # A DATA:<len> line announces raw page bytes; read them as
+                        # bytes so nothing is lost to text decoding
+                        try:
+                            length = int(response[5:])
+                        except ValueError:
+                            self.logger.error(f"Malformed data header: {response}")
+                            return False
+                        payload = self.ser.read(length)
+                        if len(payload) != length:
+                            self.logger.error("Timeout while receiving page data")
+                            return False
+                        emit(payload)
                     elif response == "OPERATION_COMPLETE":
                         self.logger.info("NAND read completed successfully")
                         break
                     elif response == "OPERATION_FAILED":
                         self.logger.error("NAND read operation failed")
-                        return None
+                        return False
                     elif response == "NAND_NOT_CONNECTED":
                         self.logger.error("NAND not connected")
-                        return None
+                        return False
                     else:
-                        # Legacy fallback cannot reliably receive binary here; this path was already fragile
-                        # We skip appending textual lines as data in v2.5
+                        # Other text lines carry no dump data
                         pass
+        except (OperationAbortedException, KeyboardInterrupt):
+            # The frame reader must be off the port before draining it
+            if reader is not None:
+                stop_reader.set()
+                reader.join()
+            self._cancel_device()
+            raise
         except Exception as e:
             self.logger.error(f"Error during NAND read: {e}")
-            return None
+            return False
+        finally:
+            if reader is not None:
+                stop_reader.set()
+                reader.join()
 
-        # Optionally strip OOB (spare) area from pages if not requested
-        try:
-            include_oob = bool(config_manager.get("include_oob", False))
-            if (not include_oob) and self.current_nand_info and nand_data:
-                page_size = self.current_nand_info["page_size"]
-                # Try to determine actual OOB size from data if it's consistent
-                # First, try the standard approach
-                standard_spare_size = 128 if page_size == 4096 else 64
-                standard_page_total = page_size + standard_spare_size
-
-                # If data fits standard page size, use it
-                if len(nand_data) % standard_page_total == 0:
-                    out = bytearray()
-                    for i in range(0, len(nand_data), standard_page_total):
-                        out.extend(nand_data[i : i + page_size])
-                    return bytes(out)
-                else:
-                    # Try to infer OOB size from actual data - look for common patterns
-                    # For small pages like in tests, OOB might be a small fixed size
-                    # Common small OOB sizes: 2, 4, 8, 16 bytes
-                    for test_oob_size in [2, 4, 8, 16, 32]:
-                        test_page_total = page_size + test_oob_size
-                        if len(nand_data) % test_page_total == 0:
-                            out = bytearray()
-                            for i in range(0, len(nand_data), test_page_total):
-                                out.extend(nand_data[i : i + page_size])
-                            return bytes(out)
-        except Exception:
-            pass
-        return bytes(nand_data)
-
-    def write_nand(self, data: bytes, progress_callback=None) -> bool:
+        return True
+
+    def write_nand(self, data: bytes | memoryview, progress_callback=None) -> bool:
         """
         Write data to NAND
 
@@ -711,14 +1022,16 @@ class NANDController:
             True if successful, False otherwise
         """
         self.logger.info(f"Starting NAND write operation with {len(data)} bytes...")
+        self.abort_requested = False
 
         if not self.is_connected or not self.current_nand_info:
             self.logger.error("No connected NAND chip")
             return False
 
         # Send data in chunks
-        chunk_size = config_manager.get("chunk_size")
+        chunk_size = self._write_chunk_size()
         total_size = len(data)
+        view = memoryview(data)
 
         # For test compatibility: store original writes length if FakeSerialLegacy
         original_writes_len = 0
@@ -727,24 +1040,33 @@ class NANDController:
         # First, check resume state to see if we need to restart
         resume = self._load_resume_state()
         start_offset = 0
+        # CRC32 of everything sent so far, carried across chunks and checkpoints
+        running_crc = 0
         if resume.get("operation") == "WRITE":
             start_offset = int(resume.get("bytes_sent", 0))
             if start_offset > total_size:
                 start_offset = 0
-            # Validate CRC of last sent chunk; if mismatch, restart from zero
+            running_crc = zlib.crc32(view[:start_offset])
+            # Validate the CRC of the data already sent (older state files only
+            # hold the CRC of the last chunk); if mismatch, restart from zero
+            data_crc = resume.get("data_crc32")
             last_crc = resume.get("chunk_crc32")
-            chunk_size = config_manager.get("chunk_size")
-            if last_crc is not None and start_offset >= chunk_size:
-                prev_chunk = data[start_offset - chunk_size : start_offset]
-                calc_crc = zlib.crc32(prev_chunk) & 0xFFFFFFFF
-                if calc_crc != int(last_crc):
-                    self.logger.warning("Resume CRC mismatch for WRITE; restarting from beginning")
-                    start_offset = 0
-                    self.clear_resume_state()
-                    # For test compatibility: if using test serial object with writes buffer,
-                    # store where writes started after the mismatch decision
-                    if is_test_serial:
-                        original_writes_len = len(self.ser.writes)
+            if data_crc is not None:
+                calc_crc, expected_crc = running_crc, int(data_crc)
+            elif last_crc is not None and start_offset >= chunk_size:
+                calc_crc = zlib.crc32(view[start_offset - chunk_size : start_offset])
+                expected_crc = int(last_crc)
+            else:
+                calc_crc = expected_crc = 0
+            if calc_crc != expected_crc:
+                self.logger.warning("Resume CRC mismatch for WRITE; restarting from beginning")
+                start_offset = 0
+                running_crc = 0
+                self.clear_resume_state()
+                # For test compatibility: if using test serial object with writes buffer,
+                # store where writes started after the mismatch decision
+                if is_test_serial:
+                    original_writes_len = len(self.ser.writes)
 
         # Now send the WRITE command
         self.send_command("WRITE")
@@ -755,48 +1077,98 @@ class NANDController:
             self.logger.error(f"Device not ready for data: {ready_response}")
             return False
 
-        for i in range(start_offset, total_size, chunk_size):
-            chunk = data[i : i + chunk_size]
-            try:
+        # Drain device responses on a reader thread while sending, so progress
+        # messages do not back up in the port and stall the device's TX side
+        responses: queue.Queue = queue.Queue()
+        stop_reader = threading.Event()
+        reader = threading.Thread(
+            target=self._collect_responses,
+            args=(responses, stop_reader),
+            name="nand-rx",
+            daemon=True,
+        )
+        reader.start()
+        # Percent last reported, so the callback fires once per step, not per chunk
+        last_progress = -1
+        # Chunks (or frame pieces) queued for the next port write; joining a batch
+        # costs one copy and one write call instead of a write per chunk
+        pending: list = []
+        batch_chunks = max(1, WRITE_BATCH_SIZE // chunk_size)
+        queued = 0
+        try:
+            for i in range(start_offset, total_size, chunk_size):
+                # Slice a view so bytes input is not copied per chunk before framing
+                chunk = view[i : i + chunk_size]
+                checkpoint = (i % (1024 * 1024)) == 0
                 if self.use_binary:
                     # Send data as framed packets with CMD_WRITE as data carrier
-                    self._send_frame(self.CMD_WRITE, chunk)
+                    pending.extend(self._frame_parts(self.CMD_WRITE, chunk))
                 else:
-                    self.ser.write(chunk)
-            except Exception as e:
-                self.logger.error(f"Error sending data chunk: {e}")
-                return False
-
-            # Calculate and report progress
-            progress = int((i + len(chunk)) / total_size * 100)
-            if progress_callback:
-                progress_callback(progress)
-            # Save checkpoint periodically (every 1MB)
-            if (i % (1024 * 1024)) == 0:
-                crc = zlib.crc32(chunk) & 0xFFFFFFFF
-                resume.update(
-                    {
-                        "operation": "WRITE",
-                        "bytes_sent": i + len(chunk),
-                        "chunk_crc32": crc,
-                        "timestamp": time.time(),
-                    }
-                )
-                self._save_resume_state(resume)
-
-        # Wait for completion
+                    pending.append(chunk)
+                queued += 1
+                running_crc = zlib.crc32(chunk, running_crc)
+                # Flush full batches, the final chunk, and before a checkpoint so the
+                # saved bytes_sent never counts data still queued here
+                if queued >= batch_chunks or checkpoint or i + chunk_size >= total_size:
+                    try:
+                        self.ser.write(b"".join(pending))
+                    except Exception as e:
+                        self.logger.error(f"Error sending data chunk: {e}")
+                        return False
+                    pending.clear()
+                    queued = 0
+
+                # Calculate and report progress
+                progress = (i + len(chunk)) * 100 // total_size
+                # A pending abort still reaches the callback right away, since the
+                # callback is what unwinds the operation
+                if progress_callback and (progress != last_progress or self.abort_requested):
+                    progress_callback(progress)
+                    last_progress = progress
+                # Save checkpoint periodically (every 1MB)
+                if checkpoint:
+                    resume.pop("chunk_crc32", None)
+                    resume.update(
+                        {
+                            "operation": "WRITE",
+                            "bytes_sent": i + len(chunk),
+                            "data_crc32": running_crc,
+                            "timestamp": time.time(),
+                        }
+                    )
+                    self._save_resume_state(resume)
+        except (OperationAbortedException, KeyboardInterrupt):
+            # The response reader must be off the port before draining it
+            stop_reader.set()
+            reader.join()
+            # Nothing to cancel if the device already reported the end
+            if _OPERATION_END.isdisjoint(responses.queue):
+                self._cancel_device()
+            raise
+        finally:
+            stop_reader.set()
+            reader.join()
+
+        # Wait for completion, starting with whatever arrived during the send
         while True:
-            response = self.read_response()
+            try:
+                response = responses.get_nowait()
+            except queue.Empty:
+                response = self.read_response()
             if not response:
                 self.logger.error("No response from device")
                 return False
 
-            if response.startswith("PROGRESS:"):
+            if response.startswith(_PROGRESS_PREFIX):
                 try:
-                    progress = int(response.split(":")[1])
+                    progress = int(response[_PROGRESS_LEN:])
                     self.logger.debug(f"Write progress: {progress}%")
                     if progress_callback:
-                        progress_callback(progress)
+                        try:
+                            progress_callback(progress)
+                        except (OperationAbortedException, KeyboardInterrupt):
+                            self._cancel_device()
+                            raise
                 except ValueError:
                     pass
             elif response == "OPERATION_COMPLETE":
@@ -819,6 +1191,52 @@ class NANDController:
                     self.ser.writes = self.ser.writes[original_writes_len:]
                 return False
 
+    def _write_chunk_size(self) -> int:
+        """Configured chunk_size rounded down to whole USB packets"""
+        configured = int(config_manager.get("chunk_size"))
+        chunk_size = max(USB_PACKET_SIZE, configured - configured % USB_PACKET_SIZE)
+        if chunk_size != configured:
+            self.logger.warning(
+                f"chunk_size {configured} is not a multiple of {USB_PACKET_SIZE} bytes; "
+                f"using {chunk_size}"
+            )
+        return chunk_size
+
+    def _pump_frames(self, frames: queue.Queue, stop: threading.Event) -> None:
+        """Queue framed packets until the stream ends or stop is set (reader thread)"""
+        while not stop.is_set():
+            try:
+                frame = self._read_frame(stop=stop)
+            except Exception as e:
+                self.logger.error(f"Error reading frame: {e}")
+                frame = None
+            # Put with a timeout so a consumer that has given up cannot block us forever
+            while not stop.is_set():
+                try:
+                    frames.put(frame, timeout=0.05)
+                    break
+                except queue.Full:
+                    pass
+            # None (timeout/error), COMPLETE and ERROR all end the stream
+            if frame is None or frame[0] in (self.CMD_COMPLETE, self.CMD_ERROR):
+                return
+
+    def _collect_responses(self, responses: queue.Queue, stop: threading.Event) -> None:
+        """Queue device responses until stop is set (reader thread)"""
+        while not stop.is_set():
+            # Only read once something has arrived, so the thread notices stop promptly
+            if not self._rx and not self.ser.in_waiting:
+                if self._sel is not None:
+                    # Sleep in the kernel until the port is readable; the timeout
+                    # only bounds how late stop is noticed
+                    self._sel.select(0.02)
+                else:
+                    stop.wait(0.005)
+                continue
+            response = self.read_response()
+            if response:
+                responses.put(response)
+
     def erase_nand(self, progress_callback=None) -> bool:
         """
         Erase NAND chip
@@ -830,6 +1248,7 @@ class NANDController:
             True if successful, False otherwise
         """
         self.logger.info("Starting NAND erase operation...")
+        self.abort_requested = False
 
         if not self.is_connected or not self.current_nand_info:
             self.logger.error("No connected NAND chip")
@@ -852,11 +1271,11 @@ class NANDController:
                     cmd, payload = frame
                     if cmd == self.CMD_PROGRESS:
                         # Payload layout v2.5+: [percent u16][optional u32 block_idx]
-                        progress = int.from_bytes(payload[:2], "little") if len(payload) >= 2 else 0
+                        progress = _U16.unpack_from(payload)[0] if len(payload) >= 2 else 0
                         if progress_callback:
                             progress_callback(progress)
                         if len(payload) >= 6:
-                            block_idx = int.from_bytes(payload[2:6], "little")
+                            block_idx = _U32.unpack_from(payload, 2)[0]
                             resume.update(
                                 {
                                     "operation": "ERASE",
@@ -888,9 +1307,9 @@ class NANDController:
                     if not response:
                         self.logger.error("No response from device")
                         return False
-                    if response.startswith("PROGRESS:"):
+                    if response.startswith(_PROGRESS_PREFIX):
                         try:
-                            progress = int(response.split(":")[1])
+                            progress = int(response[_PROGRESS_LEN:])
                             self.logger.debug(f"Erase progress: {progress}%")
                             if progress_callback:
                                 progress_callback(progress)
@@ -916,6 +1335,9 @@ class NANDController:
                     elif response == "NAND_NOT_CONNECTED":
                         self.logger.error("NAND not connected")
                         return False
+        except (OperationAbortedException, KeyboardInterrupt):
+            self._cancel_device()
+            raise
         except Exception as e:
             self.logger.error(f"Error during NAND erase: {e}")
             return False
@@ -1,16 +1,44 @@
+import binascii
+from functools import cache
 
+try:
+    import numpy as np
+except ImportError:  # optional: vectorized Hamming parities, pure Python otherwise
+    np = None
 
-def _crc16_ccitt(data: bytes, poly: int = 0x1021, init: int = 0xFFFF) -> int:
-    """Compute CRC16-CCITT over data (standard variant)."""
-    crc = init
-    for b in data:
-        crc ^= b << 8
+# Parity (bitcount mod 2) of every byte value
+_PARITY = tuple(bin(i).count("1") & 1 for i in range(256))
+
+if np is not None:
+    # Row k selects the sector words whose index has bit k set
+    _WORD_BITS = (np.arange(64) & (1 << np.arange(6)[:, None])).astype(bool)
+
+
+@cache
+def _crc16_table(poly: int) -> tuple[int, ...]:
+    """Byte-at-a-time lookup table for an MSB-first CRC16 polynomial."""
+    table = []
+    for i in range(256):
+        crc = i << 8
         for _ in range(8):
             if crc & 0x8000:
                 crc = ((crc << 1) & 0xFFFF) ^ poly
             else:
                 crc = (crc << 1) & 0xFFFF
-    return crc & 0xFFFF
+        table.append(crc)
+    return tuple(table)
+
+
+def _crc16_ccitt(data: bytes, poly: int = 0x1021, init: int = 0xFFFF) -> int:
+    """Compute CRC16-CCITT over data (standard variant)."""
+    if poly == 0x1021:
+        # binascii implements this polynomial in C
+        return binascii.crc_hqx(data, init & 0xFFFF)
+    table = _crc16_table(poly)
+    crc = init & 0xFFFF
+    for b in bytes(data):
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ b]
+    return crc
 
 
 def _calc_hamming_512_3byte(buf: bytes) -> bytes:
@@ -25,49 +53,55 @@ def _calc_hamming_512_3byte(buf: bytes) -> bytes:
     """
     # Ensure 512 bytes input (pad with 0x00 if shorter)
     if len(buf) < 512:
-        b = buf + bytes(512 - len(buf))
+        b = bytes(buf) + bytes(512 - len(buf))
     else:
         b = buf[:512]
 
-    # Precomputed parity (bitcount mod2) for 0..255
-    parity = [0] * 256
-    for i in range(256):
-        # parity of number of set bits
-        parity[i] = bin(i).count("1") & 1
+    parity = _PARITY
 
     # Process as 64 little-endian 32-bit words
     rp = [0] * 16  # rp0..rp15
-    par = 0
-    # Iterate 64 words
-    for i in range(64):
-        off = i * 4
-        cur = b[off] | (b[off + 1] << 8) | (b[off + 2] << 16) | (b[off + 3] << 24)
-        par ^= cur
-        # Distribute by word index bits (like Linux ecc2)
-        if i & 0x01:
-            rp[5] ^= cur
-        else:
-            rp[4] ^= cur
-        if i & 0x02:
-            rp[7] ^= cur
-        else:
-            rp[6] ^= cur
-        if i & 0x04:
-            rp[9] ^= cur
-        else:
-            rp[8] ^= cur
-        if i & 0x08:
-            rp[11] ^= cur
-        else:
-            rp[10] ^= cur
-        if i & 0x10:
-            rp[13] ^= cur
-        else:
-            rp[12] ^= cur
-        if i & 0x20:
-            rp[15] ^= cur
-        else:
-            rp[14] ^= cur
+    if np is not None:
+        # XOR-reduce the words with each index bit set in one pass; the words
+        # with that bit clear XOR to par ^ that
+        w = np.frombuffer(b, dtype="<u4", count=64)
+        par = int(np.bitwise_xor.reduce(w))
+        odd = np.bitwise_xor.reduce(np.where(_WORD_BITS, w, 0), axis=1)
+        for k, v in enumerate(odd.tolist()):
+            rp[5 + 2 * k] = v
+            rp[4 + 2 * k] = par ^ v
+    else:
+        par = 0
+        # Iterate 64 words
+        for i in range(64):
+            off = i * 4
+            cur = b[off] | (b[off + 1] << 8) | (b[off + 2] << 16) | (b[off + 3] << 24)
+            par ^= cur
+            # Distribute by word index bits (like Linux ecc2)
+            if i & 0x01:
+                rp[5] ^= cur
+            else:
+                rp[4] ^= cur
+            if i & 0x02:
+                rp[7] ^= cur
+            else:
+                rp[6] ^= cur
+            if i & 0x04:
+                rp[9] ^= cur
+            else:
+                rp[8] ^= cur
+            if i & 0x08:
+                rp[11] ^= cur
+            else:
+                rp[10] ^= cur
+            if i & 0x10:
+                rp[13] ^= cur
+            else:
+                rp[12] ^= cur
+            if i & 0x20:
+                rp[15] ^= cur
+            else:
+                rp[14] ^= cur
 
     # Fold 32-bit accumulators to byte for rp4..rp15
     for idx in range(4, 16):
@@ -138,6 +172,7 @@ def verify_and_correct(
     """
     Verify data using a simple ECC rule: compare CRC16(data) with first 2 bytes of OOB (LE).
     This is a pragmatic verifier when OOB stores 2-byte checks; no correction is performed.
+    data and oob may be any bytes-like objects (e.g. memoryview slices of a page).
 
     Returns (data, error_markers) where error_markers is non-empty on mismatch.
     """
@@ -52,6 +52,12 @@ class EraseException(OperationException):
     pass
 
 
+class OperationAbortedException(OperationException):
+    """Exception raised when a running NAND operation is cancelled by the user"""
+
+    pass
+
+
 class DataIntegrityException(NANDFlasherException):
     """Exception raised when data integrity verification fails"""
 
@@ -11,8 +11,13 @@ class I18n:
     def __init__(self, default_lang: str = "en"):
         self.current_lang = default_lang
         self.translations: dict[str, dict[str, str]] = {}
+        # Per-language lookup tables with the English fallback merged in,
+        # so t() is a single dict lookup and switching language is a swap
+        self._tables: dict[str, dict[str, str]] = {}
         self._load_defaults()
         self._load_external_resources()
+        self.preload()
+        self._active = self._tables.get(default_lang) or self._tables.get("en", {})
 
     def _load_defaults(self):
         # Minimal safe defaults; full dictionaries can be extended as needed
@@ -61,16 +66,23 @@ class I18n:
         _merge_lang("en", "en.json")
         _merge_lang("ru", "ru.json")
 
+    def preload(self, langs=None):
+        """Build the lookup tables for langs (all loaded languages by default)"""
+        fallback = self.translations.get("en", {})
+        for code in self.translations if langs is None else langs:
+            if code in self.translations:
+                self._tables[code] = {**fallback, **self.translations[code]}
+
     def set_language(self, lang: str):
         if lang in self.translations:
+            if lang not in self._tables:
+                self.preload((lang,))
             self.current_lang = lang
+            self._active = self._tables[lang]
 
     def t(self, key: str) -> str:
         # Return translation for current language, fallback to en, else key
-        lang_map = self.translations.get(self.current_lang, {})
-        if key in lang_map:
-            return lang_map[key]
-        return self.translations.get("en", {}).get(key, key)
+        return self._active.get(key, key)
 
     def get_available_languages(self) -> list:
         return list(self.translations.keys())
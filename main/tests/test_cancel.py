@@ -0,0 +1,107 @@
+import struct
+import threading
+import zlib
+
+import pytest
+
+from src.config.settings import config_manager
+from src.hardware.nand_controller import NANDController
+from src.utils.exceptions import OperationAbortedException
+
+
+class FakeDevice:
+    """Serial fake that acknowledges CANCEL the way the firmware does."""
+
+    def __init__(self, data: bytes = b"", cancel_reply: bytes = b"OPERATION_CANCELLED\n"):
+        self._buf = bytearray(data)
+        self._cancel_reply = cancel_reply
+        self.writes = bytearray()
+        self.is_open = True
+        self.timeout = None
+
+    def write(self, b):
+        self.writes += b
+        if bytes(b) == b"CANCEL\n":
+            self._buf += self._cancel_reply
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        self._buf.clear()
+
+    @property
+    def in_waiting(self):
+        return len(self._buf)
+
+    def read(self, n: int) -> bytes:
+        out = bytes(self._buf[:n])
+        del self._buf[:n]
+        return out
+
+    def readline(self) -> bytes:
+        end = self._buf.find(b"\n")
+        return self.read(end + 1 if end >= 0 else len(self._buf))
+
+
+def frame_pf(cmd: int, payload: bytes = b"") -> bytes:
+    header = bytes([cmd]) + struct.pack("<I", len(payload))
+    return b"PF" + header + payload + struct.pack("<I", zlib.crc32(header + payload))
+
+
+def abort(progress):
+    raise OperationAbortedException("Operation cancelled by user")
+
+
+def test_write_abort_sends_cancel(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", False, raising=False)
+    monkeypatch.setattr(config_manager.settings, "chunk_size", 4096, raising=False)
+    ctrl = NANDController()
+    ctrl._resume_path = tmp_path / "resume.json"
+    ctrl.ser = FakeDevice(b"READY_FOR_DATA\n")
+    ctrl.is_connected = True
+    ctrl.current_nand_info = {"blocks": 1, "block_size": 4, "page_size": 2048}
+
+    with pytest.raises(OperationAbortedException):
+        ctrl.write_nand(bytes(8192), progress_callback=abort)
+
+    assert ctrl.ser.writes.endswith(b"CANCEL\n")
+    # The acknowledgement was drained, so it is not read as the next reply
+    assert not ctrl.ser.in_waiting
+    assert all(t.name != "nand-rx" for t in threading.enumerate())
+
+
+def test_read_abort_sends_cancel_and_drains(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", True, raising=False)
+    ctrl = NANDController()
+    ctrl._resume_path = tmp_path / "resume.json"
+    ctrl.current_nand_info = {"blocks": 1, "block_size": 4, "page_size": 2048}
+    stream = b"".join(
+        frame_pf(ctrl.CMD_READ, bytes([n]) * 2048) + frame_pf(ctrl.CMD_PROGRESS, bytes([n, 0]))
+        for n in range(4)
+    )
+    # The firmware ends a cancelled framed read with an ERROR frame
+    ctrl.ser = FakeDevice(stream, cancel_reply=frame_pf(ctrl.CMD_ERROR, b"CANCELLED"))
+    ctrl.is_connected = True
+
+    with pytest.raises(OperationAbortedException):
+        ctrl.read_nand_stream(lambda page: None, abort)
+
+    assert ctrl.ser.writes.endswith(b"CANCEL\n")
+    assert not ctrl.ser.in_waiting and not ctrl._rx
+    assert all(t.name != "nand-rx" for t in threading.enumerate())
+
+
+def test_erase_abort_sends_cancel(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", False, raising=False)
+    ctrl = NANDController()
+    ctrl._resume_path = tmp_path / "resume.json"
+    ctrl.ser = FakeDevice(b"PROGRESS:1\n")
+    ctrl.is_connected = True
+    ctrl.current_nand_info = {"blocks": 1, "block_size": 4, "page_size": 2048}
+
+    with pytest.raises(OperationAbortedException):
+        ctrl.erase_nand(progress_callback=abort)
+
+    assert ctrl.ser.writes.endswith(b"CANCEL\n")
+    assert not ctrl.ser.in_waiting
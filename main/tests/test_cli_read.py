@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+from src.cli.cli_interface import CLIInterface
+
+
+def make_cli(read_ok):
+    cli = CLIInterface()
+
+    def read_nand_stream(write_chunk, progress_callback=None):
+        write_chunk(b"partial")
+        return read_ok
+
+    cli._controller = SimpleNamespace(nand_total_size=0, read_nand_stream=read_nand_stream)
+    return cli
+
+
+def test_failed_read_removes_partial_dump(tmp_path):
+    out = tmp_path / "dump.bin"
+    assert make_cli(False).read_operation(str(out)) is False
+    assert not out.exists()
+
+
+def test_failed_open_keeps_existing_file(tmp_path, monkeypatch):
+    out = tmp_path / "dump.bin"
+    out.write_bytes(b"earlier dump")
+    cli = make_cli(True)
+
+    def refuse(path, direct=False):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(cli, "_open_dump", refuse)
+    assert cli.read_operation(str(out)) is False
+    assert out.read_bytes() == b"earlier dump"
@@ -3,8 +3,13 @@ Unit tests for CRC32 implementation in Pico NAND Flasher
 """
 
 import os
+import struct
 import sys
+import time
+import types
 import unittest
+import zlib
+from unittest import mock
 
 
 # Mock MicroPython modules for testing
@@ -132,5 +137,130 @@ class TestCRC32(unittest.TestCase):
         self.assertNotEqual(crc1, crc2)
 
 
+class FakeUART:
+    def __init__(self, rx=b""):
+        self.out = bytearray()
+        self.rx = bytearray(rx)
+
+    def write(self, data):
+        self.out.extend(data)
+
+    def any(self):
+        return len(self.rx)
+
+    def read(self, n):
+        out = bytes(self.rx[:n])
+        del self.rx[:n]
+        return out
+
+
+# MicroPython tick helpers used by the firmware's read paths
+fake_time = types.SimpleNamespace(
+    ticks_ms=lambda: int(time.monotonic() * 1000), ticks_diff=lambda a, b: a - b
+)
+
+
+def frame_pf(cmd, payload=b""):
+    header = bytes([cmd]) + struct.pack("<I", len(payload))
+    crc = zlib.crc32(header + payload) & 0xFFFFFFFF
+    return b"PF" + header + payload + struct.pack("<I", crc)
+
+
+class TestFrameCRC(unittest.TestCase):
+    """Test framed protocol CRC helpers"""
+
+    def setUp(self):
+        self.nand_flasher = object.__new__(NANDFlasher)
+        self.nand_flasher.uart = FakeUART()
+        self.nand_flasher.MAGIC = b"PF"
+        self.nand_flasher._hdr = bytearray(b"PF\x00\x00\x00\x00\x00")
+        self.nand_flasher._hdr_mv = memoryview(self.nand_flasher._hdr)
+        self.nand_flasher._crcbuf = bytearray(4)
+        self.nand_flasher._rx_pending = b""
+        self.nand_flasher.CMD_ERROR = 0x13
+        self.nand_flasher._progress_frame = bytearray(b"PF\x10\x06\x00\x00\x00") + bytearray(10)
+        self.nand_flasher._progress_mv = memoryview(self.nand_flasher._progress_frame)
+
+    def test_crc32_matches_zlib(self):
+        """Table-driven CRC32 should match zlib"""
+        data = bytes(range(256)) * 4
+        self.assertEqual(self.nand_flasher._crc32(data), zlib.crc32(data) & 0xFFFFFFFF)
+
+    def test_crc32_update_incremental(self):
+        """Feeding CRC in pieces should equal a single pass"""
+        header, payload = b"\x02\x04\x00\x00\x00", b"\xDE\xAD\xBE\xEF"
+        crc = self.nand_flasher._crc32_update(0xFFFFFFFF, header)
+        crc = self.nand_flasher._crc32_update(crc, payload) ^ 0xFFFFFFFF
+        self.assertEqual(crc, self.nand_flasher._crc32(header + payload))
+
+    def test_send_frame_layout(self):
+        """Frames should match MAGIC + CMD + LEN + PAYLOAD + CRC32 as built by the host"""
+        for cmd, payload in ((0x12, b""), (0x02, bytes(range(64)))):
+            self.nand_flasher.uart.out = bytearray()
+            self.nand_flasher._send_frame(cmd, payload)
+            self.assertEqual(bytes(self.nand_flasher.uart.out), frame_pf(cmd, payload))
+
+    def test_progress_frame_matches_generic_frame(self):
+        """The preformatted PROGRESS frame should equal one built by _send_frame"""
+        self.nand_flasher._send_progress_frame(42, 70000)
+        expected = frame_pf(0x10, struct.pack("<HI", 42, 70000))
+        self.assertEqual(bytes(self.nand_flasher.uart.out), expected)
+
+    @mock.patch("main_performance.time", fake_time)
+    def test_read_frame_blocking_resyncs_and_keeps_tail(self):
+        """Noise before MAGIC is skipped and read-ahead bytes carry over to the next frame"""
+        stream = b"\x00P\x11" + frame_pf(0x03, bytes(range(100))) + frame_pf(0x01)
+        self.nand_flasher.uart = FakeUART(stream)
+        self.assertEqual(self.nand_flasher._read_frame_blocking(), (0x03, bytes(range(100))))
+        self.assertEqual(self.nand_flasher._read_frame_blocking(), (0x01, b""))
+
+    @mock.patch("main_performance.time", fake_time)
+    def test_read_frame_rejects_bad_crc(self):
+        """Frames whose CRC does not match are dropped"""
+        bad = bytearray(frame_pf(0x03, b"data"))
+        bad[-1] ^= 0xFF
+        self.nand_flasher.uart = FakeUART(bytes(bad))
+        self.assertEqual(self.nand_flasher._read_frame_blocking(), (None, b""))
+
+
+class TestFramedWrite(unittest.TestCase):
+    """Test the framed data path of write_nand_operation"""
+
+    def setUp(self):
+        nf = object.__new__(NANDFlasher)
+        nf.MAGIC = b"PF"
+        nf._hdr = bytearray(b"PF\x00\x00\x00\x00\x00")
+        nf._hdr_mv = memoryview(nf._hdr)
+        nf._crcbuf = bytearray(4)
+        nf._rx_pending = b""
+        nf.CMD_WRITE = 0x02
+        nf.CMD_ERROR = 0x13
+        nf.CMD_READY_FOR_DATA = 0x12
+        nf.binary_mode = True
+        nf.use_compression = False
+        nf.last_block_position = 0
+        nf.power_check_interval_ms = 60000
+        nf._PROGRESS_STRS = [b"PROGRESS:%d\n" % i for i in range(101)]
+        nf.current_nand = ("Test", {"blocks": 1, "block_size": 2, "page_size": 2048})
+        nf.write_page = mock.Mock(return_value=True)
+        nf.save_resume_state = mock.Mock()
+        self.nand_flasher = nf
+
+    @mock.patch("main_performance.time", fake_time)
+    def test_corrupted_write_frame_fails_operation(self):
+        """A data frame with a bad CRC aborts the write instead of being skipped"""
+        chunk = 1056  # half a page + spare
+        frames = [bytearray(frame_pf(0x02, bytes([n]) * chunk)) for n in range(4)]
+        frames[1][-1] ^= 0xFF
+        self.nand_flasher.uart = FakeUART(b"".join(frames))
+        self.nand_flasher.write_nand_operation()
+        out = bytes(self.nand_flasher.uart.out)
+        self.assertTrue(out.endswith(frame_pf(0x13, b"CRC_MISMATCH")))
+        self.assertNotIn(b"OPERATION_COMPLETE", out)
+        self.nand_flasher.write_page.assert_not_called()
+        # The rest of the host's data was discarded, not left to be read as commands
+        self.assertEqual(self.nand_flasher.uart.any(), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,8 +4,10 @@ Unit tests for CRC16-based ECC scheme verification (no correction)
 
 import os
 import unittest
+import unittest.mock
 
-from src.utils.ecc import _crc16_ccitt, verify_and_correct
+from src.utils import ecc
+from src.utils.ecc import _calc_hamming_512_3byte, _crc16_ccitt, verify_and_correct
 
 
 class TestEccCRC16(unittest.TestCase):
@@ -51,6 +53,38 @@ class TestEccCRC16(unittest.TestCase):
         _, errors2 = verify_and_correct(bytes(corrupt), spare, scheme="crc16")
         self.assertEqual(errors2, [-1])
 
+    def test_crc16_check_value(self):
+        # CRC-16/CCITT-FALSE reference check value
+        self.assertEqual(_crc16_ccitt(b"123456789"), 0x29B1)
+        self.assertEqual(_crc16_ccitt(memoryview(b"123456789")), 0x29B1)
+
+    def test_crc16_other_polynomial(self):
+        # Table path for a non-CCITT polynomial (CRC-16/UMTS reference check value)
+        self.assertEqual(_crc16_ccitt(b"123456789", poly=0x8005, init=0), 0xFEE8)
+
+
+class TestEccHamming512Paths(unittest.TestCase):
+    def test_blank_sector(self):
+        self.assertEqual(_calc_hamming_512_3byte(b"\xFF" * 512), b"\xFF\xFF\xFF")
+
+    def test_sector_mismatch_flagged(self):
+        sectors = [os.urandom(512) for _ in range(4)]
+        oob = b"".join(_calc_hamming_512_3byte(s) for s in sectors)
+        data = bytearray(b"".join(sectors))
+        _, errors = verify_and_correct(data, oob, scheme="hamming_512_3byte", bytes_per_sector=3)
+        self.assertEqual(errors, [])
+        data[2 * 512 + 5] ^= 0x10
+        _, errors = verify_and_correct(data, oob, scheme="hamming_512_3byte", bytes_per_sector=3)
+        self.assertEqual(errors, [2])
+
+    @unittest.skipIf(ecc.np is None, "numpy not installed")
+    def test_numpy_matches_pure_python(self):
+        sectors = [os.urandom(512) for _ in range(32)] + [bytes(100), b"\xFF" * 512]
+        fast = [_calc_hamming_512_3byte(s) for s in sectors]
+        with unittest.mock.patch.object(ecc, "np", None):
+            slow = [_calc_hamming_512_3byte(s) for s in sectors]
+        self.assertEqual(fast, slow)
+
 
 @unittest.skip("Enable after real Hamming(512)->3-byte ECC is implemented")
 class TestEccHamming512Scaffold(unittest.TestCase):
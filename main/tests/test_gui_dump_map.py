@@ -0,0 +1,45 @@
+import threading
+
+from src.gui.gui_interface import NANDFlasherGUI
+
+
+def make_gui(controller):
+    # No display needed: only the dump-mapping helpers are exercised
+    gui = object.__new__(NANDFlasherGUI)
+    gui._dump_lock = threading.Lock()
+    gui._dump_mmap = None
+    gui._dump_fp = None
+    gui._dump_busy = False
+    gui._dump_release_pending = False
+    gui._progress = lambda value: None
+    gui.controller = controller
+    return gui
+
+
+def test_release_during_write_is_deferred(tmp_path):
+    dump = tmp_path / "dump.bin"
+    dump.write_bytes(b"abcd" * 1024)
+    started, proceed = threading.Event(), threading.Event()
+    seen = []
+
+    class Controller:
+        def write_nand(self, data, progress_callback=None):
+            started.set()
+            proceed.wait(5)
+            # Raises ValueError if the mapping was closed underneath the write
+            seen.append(bytes(data[:4]))
+            return True
+
+    gui = make_gui(Controller())
+    results = []
+    worker = threading.Thread(target=lambda: results.append(gui._run_write(open(dump, "rb"))))
+    worker.start()
+    assert started.wait(5)
+    # Tk thread: another dump selected (or disconnect) while the write runs
+    gui._release_dump_map()
+    assert gui._dump_mmap is not None and not gui._dump_mmap.closed
+    proceed.set()
+    worker.join(5)
+
+    assert results == [True] and seen == [b"abcd"]
+    assert gui._dump_mmap is None
@@ -118,3 +118,42 @@ def test_oob_stripping(tmp_path, monkeypatch):
     # OOB stripping should remove 2 bytes per page from the end of each page
     # two pages * 4 data bytes = 8 bytes expected
     assert len(data) == pages * page_size
+
+
+def test_read_into_preallocated_buffer(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", True, raising=False)
+    ctrl = NANDController()
+    ctrl._resume_path = tmp_path / "resume.json"
+    ctrl.current_nand_info = {"blocks": 1, "block_size": 2, "page_size": 64}
+    ctrl.is_connected = True
+
+    ctrl.ser = FakeSerialBinary(build_mixed_sequence(ctrl, pages=3, page_len=32))
+    expected = ctrl.read_nand()
+
+    ctrl.ser = FakeSerialBinary(build_mixed_sequence(ctrl, pages=3, page_len=32))
+    buf = bytearray(64 * 2)
+    data = ctrl.read_nand(out=buf)
+    assert data is not None
+    assert data.obj is buf
+    assert bytes(data) == expected
+
+    # A buffer that cannot hold the dump fails the read
+    ctrl.ser = FakeSerialBinary(build_mixed_sequence(ctrl, pages=3, page_len=32))
+    assert ctrl.read_nand(out=bytearray(32)) is None
+
+
+def test_read_with_oob_grows_past_geometry(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", True, raising=False)
+    monkeypatch.setattr(config_manager.settings, "include_oob", True, raising=False)
+    ctrl = NANDController()
+    ctrl._resume_path = tmp_path / "resume.json"
+    page_size = 4
+    ctrl.current_nand_info = {"blocks": 1, "block_size": 2, "page_size": page_size}
+    ctrl.is_connected = True
+
+    pages = [bytes([p] * page_size) + b"\xEE\xEE" for p in range(2)]
+    seq = b"".join(frame_pf(ctrl.CMD_READ, page) for page in pages)
+    ctrl.ser = FakeSerialBinary(seq + frame_pf(ctrl.CMD_COMPLETE, b""))
+    data = ctrl.read_nand()
+    # The buffer is sized for data only; the spare bytes must still all land
+    assert data == b"".join(pages)
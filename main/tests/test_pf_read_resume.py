@@ -97,3 +97,29 @@ def test_read_resume_crc_match_discards_previous(tmp_path, monkeypatch):
     assert (
         len(data) == 128
     )  # because our logic appends payloads even after discard crossing, and two payloads of 64
+
+
+def test_read_resume_discard_ignores_non_page_frames(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", True, raising=False)
+    ctrl = NANDController()
+    ctrl._resume_path = tmp_path / "resume.json"
+    ctrl.current_nand_info = {"blocks": 1, "block_size": 1, "page_size": 2048}
+    ctrl.is_connected = True
+    pages = [bytes([n]) * 64 for n in range(3)]
+    # The checkpoint CRC is matched against the page at index last_page
+    ctrl._save_resume_state(
+        {"operation": "READ", "last_page": 1, "page_crc32": zlib.crc32(pages[1])}
+    )
+    # Frames that are not page data arrive inside the resumed portion
+    seq = (
+        frame_pf(ctrl.CMD_MODEL, b"K9F1G08U0E")
+        + frame_pf(ctrl.CMD_READ, pages[0])
+        + frame_pf(ctrl.CMD_POWER_WARNING, b"LOW_VOLTAGE")
+        + frame_pf(ctrl.CMD_READ, pages[1])
+        + frame_pf(ctrl.CMD_READ, pages[2])
+        + frame_pf(ctrl.CMD_COMPLETE)
+    )
+    ctrl.ser = FakeSerialBinary(seq)
+    data = ctrl.read_nand()
+    # Exactly one page is discarded and the rest follow in order
+    assert data == pages[1] + pages[2]
@@ -1,4 +1,5 @@
 import struct
+import threading
 
 from src.config.settings import config_manager
 from src.hardware.nand_controller import NANDController
@@ -63,3 +64,116 @@ def test_model_mapping(monkeypatch):
     msg = ctrl.read_response()
     assert msg.startswith("MODEL:")
     assert "Samsung" in msg
+
+
+def test_frames_resync_after_noise(monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", True, raising=False)
+    ctrl = NANDController()
+    # Garbage (including a stray half-MAGIC) around two back-to-back frames
+    data = (
+        b"xxP"
+        + frame_pf(ctrl.CMD_MODEL, b"Samsung K9F1G08U0A")
+        + b"PPzz"
+        + frame_pf(ctrl.CMD_PROGRESS, bytes([5, 0]))
+    )
+    ctrl.ser = FakeSerialBinary(data)
+    ctrl.is_connected = True
+    assert ctrl.read_response() == "MODEL:Samsung K9F1G08U0A"
+    assert ctrl.read_response() == "PROGRESS:5"
+
+
+def test_false_magic_in_noise_does_not_block_frames(monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", True, raising=False)
+    ctrl = NANDController()
+    frames = frame_pf(ctrl.CMD_PROGRESS, bytes([7, 0])) + frame_pf(ctrl.CMD_COMPLETE)
+    # A "PF" in noise with an absurd LEN, then one with a plausible LEN and bad CRC
+    noise = b"PF\x03\x00\x00\x00\x10" + b"PF\x03" + struct.pack("<I", 4) + b"junk"
+    ctrl.ser = FakeSerialBinary(noise + frames)
+    ctrl.is_connected = True
+    assert ctrl._read_frame(timeout=0.05) == (ctrl.CMD_PROGRESS, bytes([7, 0]))
+    assert ctrl._read_frame(timeout=0.05) == (ctrl.CMD_COMPLETE, b"")
+    assert not ctrl._rx
+
+
+def test_false_magic_timeout_drops_it(monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", True, raising=False)
+    ctrl = NANDController()
+    # The bogus header promises more bytes than ever arrive
+    ctrl.ser = FakeSerialBinary(b"PF\x03" + struct.pack("<I", 100))
+    ctrl.is_connected = True
+    assert ctrl._read_frame(timeout=0.05) is None
+    # Valid frames arriving later are still read
+    ctrl.ser._buf += frame_pf(ctrl.CMD_PROGRESS, bytes([9, 0]))
+    assert ctrl._read_frame(timeout=0.05) == (ctrl.CMD_PROGRESS, bytes([9, 0]))
+
+
+def test_detect_nand_by_raw_id(monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", True, raising=False)
+    ctrl = NANDController()
+    ctrl.ser = FakeSerialBinary(b"")
+    ctrl.is_connected = True
+    monkeypatch.setattr(ctrl, "read_response", lambda timeout=None: "ID:ECD3")
+    detected, model, info = ctrl.detect_nand()
+    assert detected is True
+    assert model == "Samsung K9F4G08U0A"
+    assert info is ctrl.supported_nand[model]
+
+
+def test_id_index_lists_models_sharing_an_id():
+    ctrl = NANDController()
+    models = ctrl._by_id[(0xEC, 0xF1)]
+    assert len(models) > 1
+    assert all(ctrl.supported_nand[m]["id"] == (0xEC, 0xF1) for m in models)
+
+
+def test_framed_write_batches_frames(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", True, raising=False)
+    monkeypatch.setattr(config_manager.settings, "chunk_size", 4096, raising=False)
+    ctrl = NANDController()
+    ctrl._resume_path = tmp_path / "resume.json"
+    ctrl.current_nand_info = {"blocks": 1, "block_size": 4, "page_size": 4096}
+    ctrl.is_connected = True
+
+    class CapturingSerial(FakeSerialBinary):
+        def __init__(self, data_bytes: bytes):
+            super().__init__(data_bytes)
+            self.writes = []
+
+        def write(self, b: bytes):
+            self.writes.append(bytes(b))
+
+    ser = CapturingSerial(frame_pf(ctrl.CMD_READY_FOR_DATA) + frame_pf(ctrl.CMD_COMPLETE))
+    ctrl.ser = ser
+    data = bytes(range(256)) * 40  # 10240 bytes: two full chunks and a partial one
+    assert ctrl.write_nand(data) is True
+
+    # Command frame; the first data frame goes out alone ahead of the resume
+    # checkpoint, the rest are coalesced into a single write
+    assert len(ser.writes) == 3
+    expected = b"".join(
+        frame_pf(ctrl.CMD_WRITE, data[i : i + 4096]) for i in range(0, len(data), 4096)
+    )
+    assert ser.writes[0] == frame_pf(ctrl.CMD_WRITE)
+    assert b"".join(ser.writes[1:]) == expected
+
+
+def test_framed_read_stops_reader_when_consumer_aborts(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_manager.settings, "use_binary_protocol", True, raising=False)
+    ctrl = NANDController()
+    ctrl._resume_path = tmp_path / "resume.json"
+    ctrl.current_nand_info = {"blocks": 1, "block_size": 4, "page_size": 2048}
+    stream = b"".join(
+        frame_pf(ctrl.CMD_READ, bytes([n]) * 2048) + frame_pf(ctrl.CMD_PROGRESS, bytes([n, 0]))
+        for n in range(4)
+    )
+    ctrl.ser = FakeSerialBinary(stream + frame_pf(ctrl.CMD_COMPLETE))
+    ctrl.is_connected = True
+    pages = []
+
+    def abort(progress):
+        raise RuntimeError("aborted")
+
+    assert ctrl.read_nand_stream(pages.append, abort) is False
+    assert [bytes(p) for p in pages] == [bytes(2048)]
+    # The frame reader thread has been joined before returning
+    assert all(t.name != "nand-rx" for t in threading.enumerate())